@@ -3,7 +3,7 @@
 
 import os
 import sys
-import time
+import threading
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -21,20 +21,43 @@ USAGE = (
 
 # -------------------- utils --------------------
 
+_COLOR = None  # resolved on first use so importing blast never touches the tty
+
 def color_enabled() -> bool:
-    return sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+    global _COLOR
+    if _COLOR is None:
+        _COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+    return _COLOR
 
 def c(code: str) -> str:
     return f"\033[{code}m" if color_enabled() else ""
 
 # palette
-BOLD = c("1")
-DIM = c("2")
-FG_NAME = c("97")      # bright white
-FG_NUM = c("36")       # cyan
-FG_HEAD = c("95")      # magenta
-FG_META = c("90")      # bright black (gray)
-RESET = c("0")
+_PALETTE_CODES = {
+    "BOLD": "1",
+    "DIM": "2",
+    "FG_NAME": "97",     # bright white
+    "FG_NUM": "36",      # cyan
+    "FG_HEAD": "95",     # magenta
+    "FG_META": "90",     # bright black (gray)
+    "RESET": "0",
+}
+
+_PALETTE = None
+
+def _pal() -> dict:
+    # escape codes by name, resolved once on first use; every printer reads them
+    # through here, so library callers get colors without any setup call
+    global _PALETTE
+    if _PALETTE is None:
+        _PALETTE = {name: c(code) for name, code in _PALETTE_CODES.items()}
+    return _PALETTE
+
+def __getattr__(name):
+    # blast.BOLD and friends still work from outside the module
+    if name in _PALETTE_CODES:
+        return _pal()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def strip_skip_flag(argv):
     skip = False
@@ -52,27 +75,93 @@ def strip_skip_flag(argv):
 # ---------------- pretty printing -------------
 
 def print_header(list_key: str, csv_name: str, n: int):
-    h = f"{BOLD}{FG_HEAD}List:{RESET} {BOLD}{list_key}{RESET}  {FG_META}|{RESET}  {FG_HEAD}CSV:{RESET} {csv_name}"
+    p = _pal()
+    bold, head, meta, reset = p["BOLD"], p["FG_HEAD"], p["FG_META"], p["RESET"]
+    h = f"{bold}{head}List:{reset} {bold}{list_key}{reset}  {meta}|{reset}  {head}CSV:{reset} {csv_name}"
     print(h)
-    print(f"{FG_META}Recipients ({n}):{RESET}")
+    print(f"{meta}Recipients ({n}):{reset}")
 
-def print_recipients(resolved):
-    # compute column widths
+def _widths(resolved):
     idx_w = len(str(len(resolved)))
     name_w = max(len(c.name) for c in resolved) if resolved else 4
     num_w = max(len(c.number) for c in resolved) if resolved else 10
+    return idx_w, name_w, num_w
+
+def write_out(buf: bytearray):
+    # one write for a whole block of lines instead of a print() per line
+    sys.stdout.flush()
+    sys.stdout.buffer.write(buf)
+    sys.stdout.buffer.flush()
+
+def _print_recipients_color(resolved):
+    idx_w, name_w, num_w = _widths(resolved)
+    p = _pal()
+    bold, dim, reset = p["BOLD"], p["DIM"], p["RESET"]
+    fg_name, fg_num = p["FG_NAME"], p["FG_NUM"]
 
     # header line
     hdr = f" {'#'.rjust(idx_w)}  {'Name'.ljust(name_w)}  {'Number'.rjust(num_w)} "
-    print(f"{FG_META}{hdr}{RESET}")
+    buf = bytearray(f"{p['FG_META']}{hdr}{reset}\n".encode())
 
     # rows
     for i, ctd in enumerate(resolved, 1):
         idx = str(i).rjust(idx_w)
         name = ctd.name.ljust(name_w)
         num = ctd.number.rjust(num_w)
-        line = f" {DIM}{idx}{RESET}  {BOLD}{FG_NAME}{name}{RESET}  {FG_NUM}{num}{RESET}"
-        print(line)
+        buf += f" {dim}{idx}{reset}  {bold}{fg_name}{name}{reset}  {fg_num}{num}{reset}\n".encode()
+    write_out(buf)
+
+def _print_recipients_plain(resolved):
+    idx_w, name_w, num_w = _widths(resolved)
+    row = " {:>{iw}}  {:<{nw}}  {:>{xw}}\n"
+    buf = bytearray(row.format("#", "Name", "Number ", iw=idx_w, nw=name_w, xw=num_w + 1).encode())
+    for i, ctd in enumerate(resolved, 1):
+        buf += row.format(i, ctd.name, ctd.number, iw=idx_w, nw=name_w, xw=num_w).encode()
+    write_out(buf)
+
+def print_recipients(resolved):
+    if color_enabled():
+        _print_recipients_color(resolved)
+    else:
+        _print_recipients_plain(resolved)
+
+# -------------------- sending --------------------
+
+SEND_DELAY = 0.6
+SEND_CHUNK = 8
+# osascript batches in flight at once: the next one starts up while the current
+# one is still sending, so process launch overlaps instead of adding to the wait
+SEND_WORKERS = 2
+
+def send_all(pairs, report):
+    # pairs go out in osascript batches of SEND_CHUNK on a small pool. core's shared
+    # limiter books each batch len * SEND_DELAY of send time, so Messages still never
+    # sees two sends closer than SEND_DELAY, batch boundaries included. report() is
+    # handed each batch's results in order, as soon as that batch is done
+    from concurrent.futures import ThreadPoolExecutor
+
+    stop = threading.Event()  # set on abort: a batch still waiting for its slot gives up
+
+    def paced_batch(batch):
+        core.wait_send_slot(SEND_DELAY * len(batch))
+        if stop.is_set():
+            return [(False, "canceled")] * len(batch)
+        return core.send_messages_batch(batch, delay=SEND_DELAY)
+
+    chunks = [pairs[i:i + SEND_CHUNK] for i in range(0, len(pairs), SEND_CHUNK)]
+    futures = []
+    with ThreadPoolExecutor(max_workers=SEND_WORKERS) as pool:
+        try:
+            for i in range(len(chunks)):
+                # never more than SEND_WORKERS batches submitted ahead of the one reported
+                while len(futures) < min(len(chunks), i + SEND_WORKERS):
+                    futures.append(pool.submit(paced_batch, chunks[len(futures)]))
+                report(futures[i].result())
+        except BaseException:
+            # Ctrl-C: drop queued batches instead of letting the pool drain them
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
 # -------------------- main --------------------
 
@@ -107,22 +196,23 @@ def main():
     if tokens is None or not message:
         print(USAGE); sys.exit(1)
 
-    contacts = core.load_contacts(core.CSV_MAP[list_key])
+    contacts, index = core.load_contacts_indexed(core.CSV_MAP[list_key])
     message = core.normalize_message(message)
-    resolved, missing = core.resolve_tokens(tokens, contacts)
+    resolved, missing = core.resolve_tokens(tokens, contacts, index)
 
     if not resolved:
         print("No recipients matched.")
-        if missing: print("Unmatched:", ", ".join(missing))
+        if missing: print("Unmatched:", core.describe_missing(missing, contacts))
         sys.exit(1)
 
     print_header(list_key, core.CSV_MAP[list_key].name, len(resolved))
     print_recipients(resolved)
 
+    p = _pal()
     if missing:
-        print(f"\n{FG_META}Unmatched (ignored): {', '.join(missing)}{RESET}")
+        print(f"\n{p['FG_META']}Unmatched (ignored): {core.describe_missing(missing, contacts)}{p['RESET']}")
 
-    print(f"\n{FG_HEAD}Message:{RESET}\n")
+    print(f"\n{p['FG_HEAD']}Message:{p['RESET']}\n")
     print(message)
     print()
 
@@ -133,19 +223,29 @@ def main():
 
     sent = failed = 0
     failures = []
-    for c in resolved:
-        per = core.personalize(message, c.first)
-        print(f"  -> {c.name} ... ", end="", flush=True)
-        ok, _detail = core.send_message(c.number, per)
-        if ok:
-            print("OK"); sent += 1
-        else:
-            print("FAIL"); failed += 1; failures.append(c.name)
-        time.sleep(0.6)
-
-    print(f"\n✅ Done. Sent: {sent}  |  Failed: {failed}")
+    # personalize everything up front (repeat first names hit core's cache), then send
+    messages = [core.personalize(message, c.first) for c in resolved]
+    pairs = [(c.number, per) for c, per in zip(resolved, messages)]
+    pending = iter(resolved)
+
+    def report(results):
+        # one write per batch, as soon as that batch is done
+        nonlocal sent, failed
+        buf = bytearray()
+        # results first: zip stops on it before pulling a contact from the next batch
+        for (ok, _detail), c in zip(results, pending):
+            if ok:
+                buf += f"  -> {c.name} ... OK\n".encode(); sent += 1
+            else:
+                buf += f"  -> {c.name} ... FAIL\n".encode(); failed += 1; failures.append(c.name)
+        write_out(buf)
+
+    send_all(pairs, report)
+
+    buf = bytearray(f"\n✅ Done. Sent: {sent}  |  Failed: {failed}\n".encode())
     if failures:
-        print("Failed:", ", ".join(failures))
+        buf += f"Failed: {', '.join(failures)}\n".encode()
+    write_out(buf)
 
 if __name__ == "__main__":
     main()
@@ -3,15 +3,20 @@
 
 from __future__ import annotations
 
+import bisect
 import csv
+import functools
+import io
 import os
 import re
-import shlex
 import subprocess
+import threading
+import time
 import unicodedata
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 LISTS_DIR = ROOT / "lists"
@@ -25,25 +30,85 @@ CSV_MAP = {
 }
 
 AS_PATH = ENGINE_DIR / "send_imessage.applescript"
+BATCH_AS_PATH = ENGINE_DIR / "send_imessage_batch.applescript"
+
+_PUNCT_RE = re.compile(r"[.,]")
+# everything but digits and "+"; stripped from phone numbers by every entry point
+NUMBER_CLEAN_RE = re.compile(r"[^\d+]")
+_ALIAS_RE = re.compile(r"[,\s;/]+")
+_NAMES_SPLIT_RE = re.compile(r"\s*,\s*")
+_NAME_TOKEN_RE = re.compile(r'"([^"]*)"|\'([^\']*)\'|(\S+)')
+_TARGETS_RE = re.compile(r"^(?:to\s+)?(.+?)\s*:\s*(.+)$", re.IGNORECASE)
+_LEADING_WS_RE = re.compile(r"\n[ \t]+")
+# longest markers first so "####" wins over "##" at the same position
+_BREAK_RE = re.compile(r"########|####|##|\|\|\|\||\|\||\\\\n|\\n")
+_BREAKS = {
+    "########": "\n\n",
+    "####": "\n\n",
+    "##": "\n",
+    "||||": "\n\n",
+    "||": "\n",
+    "\\\\n": "\n",
+    "\\n": "\n",
+}
+_NAME_TAG_RE = re.compile(r"(\[(?:names?)\]|\{(?:names?)\})", re.IGNORECASE)
+_DASH_N_RE = re.compile(r"(?<!\S)-[nN](?=$|\s|[.,;:!?])")
 
 
 @dataclass(frozen=True)
 class Contact:
+    # declared by hand rather than dataclass(slots=True) so Python 3.9 still works
+    __slots__ = ("name", "first", "number", "name_l", "aliases", "words", "sort_key", "search_key")
+
     name: str
     first: str
     number: str
     name_l: str
     aliases: Tuple[str, ...]
+    words: Tuple[str, ...]
+    sort_key: str  # name.lower(), the display order used by every picker
+    search_key: str  # casefolded "name number aliases", the text pickers filter on
+
+
+# (alias -> contact idx, sorted name words, contact idx owning each word)
+_Index = Tuple[Dict[str, int], List[str], List[int]]
+
+# file stamp: (mtime_ns, size), so a rewrite inside one mtime tick still shows up
+# on filesystems with coarse timestamps as long as the size moved
+_Stamp = Tuple[int, int]
+
+# path -> (stamp, contacts, token index)
+_CONTACTS_CACHE: Dict[Path, Tuple[_Stamp, List[Contact], _Index]] = {}
+
+# path -> (stamp, contacts ordered by lowercased name)
+_SORTED_CACHE: Dict[Path, Tuple[_Stamp, List[Contact]]] = {}
+
+# path -> (stamp, every number in the list), for duplicate checks
+_NUMBERS_CACHE: Dict[Path, Tuple[_Stamp, FrozenSet[str]]] = {}
 
 
-def _norm(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-    s = re.sub(r"[.,]", " ", s.lower())
+# Latin-1 / Latin Extended-A folded to ASCII up front; anything the table
+# leaves non-ASCII still goes through NFKD below
+_DIACRITIC_MAP = str.maketrans({
+    c: unicodedata.normalize("NFKD", c).encode("ascii", "ignore").decode("ascii") or c
+    for c in map(chr, range(0x80, 0x180))
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_name(s: str) -> str:
+    if not s.isascii():
+        s = s.translate(_DIACRITIC_MAP)
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    s = s.lower()
+    if "." in s or "," in s:
+        s = _PUNCT_RE.sub(" ", s)
     return " ".join(s.split())
 
 
 def first_name(full: str) -> str:
-    n = _norm(full)
+    n = normalize_name(full)
     return n.split(" ")[0] if n else ""
 
 
@@ -64,92 +129,166 @@ def list_entries() -> List[Tuple[str, Path]]:
     return entries
 
 
+def _cached_contacts(csv_path: Path) -> Tuple[_Stamp, List[Contact], _Index]:
+    # one stat, one cache lookup: everything returned belongs to the same read
+    try:
+        st = csv_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Roster CSV missing: {csv_path}") from None
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _CONTACTS_CACHE.get(csv_path)
+    if hit is None or hit[0] != stamp:
+        contacts = _load_contacts_uncached(csv_path)
+        hit = (stamp, contacts, _build_index(contacts))
+        _CONTACTS_CACHE[csv_path] = hit
+    return hit
+
+
 def load_contacts(csv_path: Path) -> List[Contact]:
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Roster CSV missing: {csv_path}")
+    # callers may append/remove before writing back, so hand out a copy
+    return list(_cached_contacts(csv_path)[1])
+
+
+def load_contacts_indexed(csv_path: Path) -> Tuple[List[Contact], _Index]:
+    # the token index holds positions into the contacts, so the two must come
+    # from one lookup; fetching them separately could pair an index with a
+    # newer or older file and resolve a name to the wrong person
+    _stamp, contacts, index = _cached_contacts(csv_path)
+    return list(contacts), index
+
+
+def load_contacts_sorted(csv_path: Path) -> List[Contact]:
+    stamp, contacts, _index = _cached_contacts(csv_path)
+    hit = _SORTED_CACHE.get(csv_path)
+    if hit is None or hit[0] != stamp:
+        hit = (stamp, sorted(contacts, key=attrgetter("sort_key")))
+        _SORTED_CACHE[csv_path] = hit
+    return list(hit[1])
+
+
+def load_numbers(csv_path: Path) -> FrozenSet[str]:
+    stamp, contacts, _index = _cached_contacts(csv_path)
+    hit = _NUMBERS_CACHE.get(csv_path)
+    if hit is None or hit[0] != stamp:
+        hit = (stamp, frozenset(c.number for c in contacts))
+        _NUMBERS_CACHE[csv_path] = hit
+    return hit[1]
+
+
+def _load_contacts_uncached(csv_path: Path) -> List[Contact]:
     contacts: List[Contact] = []
-    with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = (row.get("name") or row.get("Name") or "").strip()
-            raw = (row.get("number") or row.get("Number") or row.get("Phone") or "").strip()
-            alias_raw = (row.get("alias") or row.get("Alias") or "").strip()
-            if not name or not raw:
-                continue
-            number = re.sub(r"[^\d+]", "", raw)
-            aliases = (
-                tuple(a.lower() for a in re.split(r"[,\s;/]+", alias_raw) if a.strip())
-                if alias_raw
-                else ()
-            )
-            contacts.append(
-                Contact(
-                    name=name,
-                    first=first_name(name),
-                    number=number,
-                    name_l=_norm(name),
-                    aliases=aliases,
-                )
+    # one read + in-memory parse; newline="" leaves line endings to csv
+    data = csv_path.read_bytes().decode("utf-8-sig", errors="replace")
+    reader = csv.reader(io.StringIO(data, newline=""))
+    header = [h.strip().lower() for h in next(reader, [])]
+    if "name" not in header:
+        return contacts
+    name_i = header.index("name")
+    num_i = next((header.index(k) for k in ("number", "phone") if k in header), None)
+    if num_i is None:
+        return contacts
+    alias_i = header.index("alias") if "alias" in header else -1
+    for row in reader:
+        if len(row) <= name_i or len(row) <= num_i:
+            continue
+        name = row[name_i].strip()
+        raw = row[num_i].strip()
+        alias_raw = row[alias_i].strip() if 0 <= alias_i < len(row) else ""
+        if not name or not raw:
+            continue
+        number = NUMBER_CLEAN_RE.sub("", raw)
+        aliases = (
+            tuple(a.lower() for a in _ALIAS_RE.split(alias_raw) if a.strip())
+            if alias_raw
+            else ()
+        )
+        name_norm = normalize_name(name)
+        words = tuple(name_norm.split())
+        contacts.append(
+            Contact(
+                name=name,
+                first=words[0] if words else "",
+                number=number,
+                name_l=name_norm,
+                aliases=aliases,
+                words=words,
+                sort_key=name.lower(),
+                search_key=" ".join((name, number, *aliases)).casefold(),
             )
+        )
     return contacts
 
 
 def make_contact(name: str, number: str, alias_raw: str = "") -> Contact:
     aliases = (
-        tuple(a.lower() for a in re.split(r"[,\s;/]+", alias_raw) if a.strip())
+        tuple(a.lower() for a in _ALIAS_RE.split(alias_raw) if a.strip())
         if alias_raw
         else ()
     )
-    name_norm = _norm(name)
+    name_norm = normalize_name(name)
+    words = tuple(name_norm.split())
+    name = name.strip()
     return Contact(
-        name=name.strip(),
-        first=first_name(name),
+        name=name,
+        first=words[0] if words else "",
         number=number,
         name_l=name_norm,
         aliases=aliases,
+        words=words,
+        sort_key=name.lower(),
+        search_key=" ".join((name, number, *aliases)).casefold(),
     )
 
 
+def _csv_field(value: str) -> str:
+    # csv's QUOTE_MINIMAL rule: quote only fields holding a comma, quote or newline
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 def write_contacts(csv_path: Path, contacts: List[Contact]) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     tmp = csv_path.with_suffix(csv_path.suffix + ".tmp")
-    with open(tmp, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["name", "number", "alias"])
-        writer.writeheader()
-        for contact in sorted(contacts, key=lambda c: c.name.lower()):
-            writer.writerow(
-                {
-                    "name": contact.name,
-                    "number": contact.number,
-                    "alias": ",".join(contact.aliases),
-                }
-            )
+    # rows are formatted straight into one buffer and written in a single call;
+    # the output is byte-for-byte what csv.DictWriter produced (\r\n line ends)
+    field = _csv_field
+    lines = ["name,number,alias"]
+    for contact in sorted(contacts, key=attrgetter("sort_key")):
+        lines.append(
+            f"{field(contact.name)},{field(contact.number)},{field(','.join(contact.aliases))}"
+        )
+    lines.append("")
+    with open(tmp, "wb") as f:
+        f.write("\r\n".join(lines).encode("utf-8"))
         f.flush()
         os.fsync(f.fileno())
     os.replace(tmp, csv_path)
+    _CONTACTS_CACHE.pop(csv_path, None)
+    _SORTED_CACHE.pop(csv_path, None)
+    _NUMBERS_CACHE.pop(csv_path, None)
 
 
 def dedup(people: Iterable[Contact]) -> List[Contact]:
-    out: List[Contact] = []
-    seen = set()
+    seen: Dict[str, Contact] = {}
     for c in people:
-        if c.number not in seen:
-            out.append(c)
-            seen.add(c.number)
-    return out
+        seen.setdefault(c.number, c)
+    return list(seen.values())
 
 
 def tokenize_names(names_raw: str) -> List[str]:
     parts: List[str] = []
-    for chunk in re.split(r"\s*,\s*", names_raw):
-        if chunk:
-            parts.extend(shlex.split(chunk))
-    return [t for t in parts if t]
+    for chunk in _NAMES_SPLIT_RE.split(names_raw):
+        for m in _NAME_TOKEN_RE.finditer(chunk):
+            tok = m.group(1) or m.group(2) or m.group(3)
+            if tok:
+                parts.append(tok)
+    return parts
 
 
 def parse_targets_message(raw: str) -> Tuple[Optional[List[str]], Optional[str]]:
     raw = raw.strip()
-    m = re.match(r"^(?:to\s+)?(.+?)\s*:\s*(.+)$", raw, flags=re.IGNORECASE)
+    m = _TARGETS_RE.match(raw)
     if not m:
         return None, None
     names_raw, message = m.group(1).strip(), m.group(2).strip()
@@ -157,62 +296,204 @@ def parse_targets_message(raw: str) -> Tuple[Optional[List[str]], Optional[str]]
     return tokens, message
 
 
-def resolve_tokens(tokens: List[str], contacts: List[Contact]) -> Tuple[List[Contact], List[str]]:
+def _build_index(contacts: List[Contact]) -> _Index:
+    alias_idx: Dict[str, int] = {}
+    for i, c in enumerate(contacts):
+        for a in c.aliases:
+            alias_idx.setdefault(a, i)
+    pairs = sorted((word, i) for i, c in enumerate(contacts) for word in c.words)
+    return alias_idx, [w for w, _i in pairs], [i for _w, i in pairs]
+
+
+def resolve_tokens(
+    tokens: List[str],
+    contacts: List[Contact],
+    index: Optional[_Index] = None,
+) -> Tuple[List[Contact], List[str]]:
     if any(t.lower() == "all" for t in tokens):
         return dedup(contacts), []
+    alias_idx, words, owners = index if index is not None else _build_index(contacts)
     chosen: List[Contact] = []
     missing: List[str] = []
     for tok in tokens:
-        t = _norm(tok)
-        alias_hits = [c for c in contacts if t in c.aliases]
-        if alias_hits:
-            chosen.append(alias_hits[0])
-            continue
-        hits = [
-            c
-            for c in contacts
-            if t in c.name_l or any(p.startswith(t) for p in c.name_l.split())
-        ]
-        if not hits:
+        t = normalize_name(tok)
+        hit = alias_idx.get(t)
+        if hit is None:
+            # every word starting with t sits in one contiguous run of the sorted list
+            pos = bisect.bisect_left(words, t)
+            end = pos
+            while end < len(words) and words[end].startswith(t):
+                end += 1
+            if end > pos:
+                hit = min(owners[pos:end])
+            else:
+                hit = next((i for i, c in enumerate(contacts) if t in c.name_l), None)
+        if hit is None:
             missing.append(tok)
         else:
-            starts = [c for c in hits if any(p.startswith(t) for p in c.name_l.split())]
-            chosen.append((starts or hits)[0])
+            chosen.append(contacts[hit])
     return dedup(chosen), missing
 
 
-def normalize_message(msg: str) -> str:
-    msg = (
-        msg.replace("########", "\n\n")
-        .replace("####", "\n\n")
-        .replace("##", "\n")
-        .replace("||||", "\n\n")
-        .replace("||", "\n")
-        .replace("\\\\n", "\n")
-        .replace("\\n", "\n")
+
+@functools.lru_cache(maxsize=None)
+def _osa_distance():
+    # rapidfuzz is optional and only needed once a token fails to resolve
+    try:
+        from rapidfuzz.distance import OSA
+    except ImportError:
+        return None
+    return OSA.distance
+
+
+def suggest_contacts(tokens: List[str], contacts: List[Contact]) -> Dict[str, Contact]:
+    # "did you mean" for tokens resolve_tokens left unmatched; never auto-resolved.
+    # per name word / alias edit distance (a swapped pair counts once): at most 1
+    # for 4-5 letters, 2 for longer. shorter tokens and ties get no suggestion
+    distance = _osa_distance()
+    out: Dict[str, Contact] = {}
+    if distance is None:
+        return out
+    for tok in tokens:
+        t = normalize_name(tok)
+        if len(t) < 4:
+            continue
+        limit = 1 if len(t) <= 5 else 2
+        best = limit + 1
+        found: Optional[Contact] = None
+        tied = False
+        for c in contacts:
+            d = min(
+                (distance(t, w, score_cutoff=limit) for w in (*c.words, *c.aliases)),
+                default=limit + 1,
+            )
+            if d < best:
+                best, found, tied = d, c, False
+            elif d == best and found is not None and c.number != found.number:
+                tied = True
+        if found is not None and not tied:
+            out[tok] = found
+    return out
+
+
+
+def describe_missing(missing: List[str], contacts: List[Contact]) -> str:
+    hints = suggest_contacts(missing, contacts)
+    return ", ".join(
+        f"{tok} (did you mean {hints[tok].name}?)" if tok in hints else tok for tok in missing
     )
-    msg = re.sub(r"\n[ \t]+", "\n", msg)
-    return msg
+
+
+def normalize_message(msg: str) -> str:
+    msg = _BREAK_RE.sub(lambda m: _BREAKS[m.group(0)], msg)
+    return _LEADING_WS_RE.sub("\n", msg)
 
 
 def personalize(template: str, first_lower: str) -> str:
+    return _personalize_cached(template, first_lower)
+
+
+@functools.lru_cache(maxsize=256)
+def _personalize_cached(template: str, first_lower: str) -> str:
     first_title = first_lower.capitalize()
-    msg = re.sub(r"(\[(?:names?)\]|\{(?:names?)\})", first_lower, template, flags=re.IGNORECASE)
+    msg = _NAME_TAG_RE.sub(first_lower, template)
 
     def _n(m: re.Match[str]) -> str:
         return first_title if m.group(0) == "-N" else first_lower
 
-    msg = re.sub(r"(?<!\S)-[nN](?=$|\s|[.,;:!?])", _n, msg)
+    msg = _DASH_N_RE.sub(_n, msg)
     return msg
 
 
+_SEND_LOCK = threading.Lock()
+_next_send = 0.0
+
+
+def wait_send_slot(delay: float) -> None:
+    # one limiter for every sending thread in the process: each caller is handed a
+    # start time at least `delay` after the previous caller's, then sleeps until it
+    global _next_send
+    with _SEND_LOCK:
+        now = time.monotonic()
+        start = max(now, _next_send)
+        _next_send = start + delay
+    if start > now:
+        time.sleep(start - now)
+
+
 def send_message(handle: str, message: str, applescript_path: Path = AS_PATH) -> Tuple[bool, str]:
-    if not applescript_path.exists():
+    try:
+        proc = subprocess.run(
+            ["osascript", str(applescript_path), handle, message],
+            text=True,
+            capture_output=True,
+        )
+    except OSError as exc:
+        # osascript could not be launched at all (E2BIG, ENOENT, ...)
+        return False, str(exc)
+    if proc.returncode != 0 and not applescript_path.exists():
         raise FileNotFoundError(f"AppleScript missing: {applescript_path}")
-    proc = subprocess.run(
-        ["osascript", str(applescript_path), handle, message],
-        text=True,
-        capture_output=True,
-    )
     detail = (proc.stdout or proc.stderr or "").strip()
     return proc.returncode == 0, detail
+
+
+# argv bytes per osascript launch; ARG_MAX is 1 MiB on macOS and shared with the
+# environment, so stay well clear of E2BIG
+ARGV_BUDGET = 128 * 1024
+
+
+def _argv_batches(pairs: List[Tuple[str, str]], budget: int) -> Iterable[List[Tuple[str, str]]]:
+    # consecutive runs of pairs whose args fit the budget; a pair too big on its
+    # own still gets a run of one, and its launch failure is reported as FAIL
+    batch: List[Tuple[str, str]] = []
+    used = 0
+    for pair in pairs:
+        # each arg costs its bytes, a NUL and an argv pointer
+        size = sum(len(arg.encode("utf-8")) + 9 for arg in pair)
+        if batch and used + size > budget:
+            yield batch
+            batch, used = [], 0
+        batch.append(pair)
+        used += size
+    if batch:
+        yield batch
+
+
+def send_messages_batch(
+    pairs: List[Tuple[str, str]],
+    applescript_path: Path = BATCH_AS_PATH,
+    delay: float = 0.6,
+) -> List[Tuple[bool, str]]:
+    # as few osascript processes as the argv budget allows; the script waits `delay`
+    # between sends and so do we between processes. one (ok, detail) per pair
+    results: List[Tuple[bool, str]] = []
+    for i, batch in enumerate(_argv_batches(pairs, ARGV_BUDGET)):
+        if i:
+            time.sleep(delay)
+        results.extend(_send_batch(batch, applescript_path, delay))
+    return results
+
+
+def _send_batch(
+    pairs: List[Tuple[str, str]], applescript_path: Path, delay: float
+) -> List[Tuple[bool, str]]:
+    # one osascript process; it reports one OK/FAIL line per pair, unreported
+    # pairs count as failed
+    args = ["osascript", str(applescript_path), str(int(delay * 1000))]
+    for handle, message in pairs:
+        args.extend((handle, message))
+    try:
+        proc = subprocess.run(args, text=True, capture_output=True)
+    except OSError as exc:
+        # osascript could not be launched at all (E2BIG, ENOENT, ...)
+        return [(False, str(exc))] * len(pairs)
+    if proc.returncode != 0 and not applescript_path.exists():
+        raise FileNotFoundError(f"AppleScript missing: {applescript_path}")
+    results: List[Tuple[bool, str]] = []
+    for line in (proc.stdout or "").splitlines():
+        status, _, detail = line.partition("\t")
+        if status in ("OK", "FAIL"):
+            results.append((status == "OK", detail.strip()))
+    detail = (proc.stderr or "").strip()
+    results.extend((False, detail) for _ in range(len(pairs) - len(results)))
+    return results[: len(pairs)]
@@ -2,9 +2,18 @@
 # engine/edit_list.py — roster editor used by: fimg -e [a|r] [list]
 # CSV schema: name,number,alias
 
-import sys, csv, re, os, unicodedata, readline
+import sys, csv, re, os, bisect, readline
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, FrozenSet
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# one name normalizer (and diacritic table) and one number cleaner for the whole
+# tool, shared with core
+from engine.core import NUMBER_CLEAN_RE, normalize_name
 
 # Force line-buffered stdout so prints appear before raw key reads
 try:
@@ -45,7 +54,6 @@ def confirm_enter_else_cancel(prompt: str) -> bool:
     return _read_single_key(prompt) in ("\r", "\n")
 
 # ---------- paths & list resolution ----------
-ROOT  = Path(__file__).resolve().parents[1]
 LISTS = ROOT / "lists"
 
 def resolve_csv(arg: str) -> Path:
@@ -59,7 +67,9 @@ def resolve_csv(arg: str) -> Path:
 
 def list_choices() -> List[Path]:
     LISTS.mkdir(parents=True, exist_ok=True)
-    return sorted(LISTS.glob("*.csv"))
+    with os.scandir(LISTS) as it:
+        return sorted(Path(e.path) for e in it
+                      if e.name.endswith(".csv") and not e.name.startswith(".") and e.is_file())
 
 def _pick_one_key(max_n: int, prompt: str) -> Optional[int]:
     """
@@ -102,46 +112,100 @@ def pick_from(paths: List[Path], title: str) -> Optional[Path]:
     return paths[idx - 1]
 
 # ---------- util & IO ----------
-def _norm(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-    s = re.sub(r"[.,]", " ", s.lower())
-    return " ".join(s.split())
+_RE_SPLIT      = re.compile(r"[,\s;/]+")   # alias cells
+_RE_TOKENS     = re.compile(r"[,\s]+")     # typed name lists
 
-def _initials(name_norm: str) -> str:
-    parts = [p for p in name_norm.split() if p]
+def _initials(parts: Tuple[str, ...]) -> str:
     return "".join(p[0] for p in parts)
 
-def load_contacts(csv_path: Path) -> List[Dict]:
-    if not csv_path.exists(): return []
+class Contact:
+    """One roster row plus the normalized fields score_match reads."""
+    __slots__ = ("name", "number", "alias", "name_l", "name_parts", "first_l", "last_l",
+                 "inits", "aliases", "sort_key")
+
+    def __init__(self, name: str, number: str, alias: str, name_l: str,
+                 name_parts: Tuple[str, ...], first_l: str, last_l: str, inits: str,
+                 aliases: FrozenSet[str]):
+        self.name, self.number, self.alias = name, number, alias
+        self.name_l, self.name_parts = name_l, name_parts
+        self.first_l, self.last_l = first_l, last_l
+        self.inits, self.aliases = inits, aliases
+        # name.lower(), the same key core.Contact sorts on when it writes a list
+        self.sort_key = name.lower()
+
+def make_contact(name: str, number: str, alias: str) -> Contact:
+    # interned so repeated first names/initials share one object and == can hit on identity
+    name_l = sys.intern(normalize_name(name))
+    parts = tuple(sys.intern(p) for p in name_l.split())
+    return Contact(
+        name, number, alias, name_l, parts,
+        parts[0] if parts else "",
+        parts[-1] if parts else "",
+        sys.intern(_initials(parts)),
+        frozenset(sys.intern(a.lower()) for a in _RE_SPLIT.split(alias) if a.strip()) if alias else frozenset(),
+    )
+
+# (alias / full name / short initials -> contact idxs, sorted name words,
+#  contact idx owning each word), positions into one load_contacts result
+_Index = Tuple[Dict[str, List[int]], List[str], List[int]]
+
+# path -> ((mtime_ns, size), contacts, index), same stamp core keys its cache on
+_CONTACTS_CACHE: Dict[Path, Tuple[Tuple[int, int], List[Contact], _Index]] = {}
+
+def _cached_contacts(csv_path: Path) -> Optional[Tuple[List[Contact], _Index]]:
+    try:
+        st = csv_path.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _CONTACTS_CACHE.get(csv_path)
+    if hit is None or hit[0] != stamp:
+        people = _parse_contacts(csv_path)
+        hit = _CONTACTS_CACHE[csv_path] = (stamp, people, _build_index(people))
+    return hit[1], hit[2]
+
+def load_contacts(csv_path: Path) -> List[Contact]:
+    """
+    Parsed once per (mtime, size) of the roster; returns a fresh list each call,
+    since callers extend or filter it before writing it back.
+    """
+    hit = _cached_contacts(csv_path)
+    return list(hit[0]) if hit else []
+
+def load_contacts_indexed(csv_path: Path) -> Tuple[List[Contact], _Index]:
+    # one lookup for both, so the index never points into another version of the file
+    hit = _cached_contacts(csv_path)
+    return (list(hit[0]), hit[1]) if hit else ([], ({}, [], []))
+
+def _parse_contacts(csv_path: Path) -> List[Contact]:
     out = []
     with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # header name -> column, case-insensitive; the first duplicate column wins
+        idx = {h.strip().lower(): i for i, h in reversed(list(enumerate(next(reader, []))))}
+        name_i  = idx.get("name")
+        num_i   = idx.get("number", idx.get("phone"))
+        alias_i = idx.get("alias")
+        if name_i is None or num_i is None: return out
         for row in reader:
-            name = (row.get("name") or row.get("Name") or "").strip()
-            raw  = (row.get("number") or row.get("Number") or row.get("Phone") or "").strip()
-            alias_raw = (row.get("alias") or row.get("Alias") or "").strip()
+            if len(row) <= name_i or len(row) <= num_i: continue
+            name = row[name_i].strip()
+            raw  = row[num_i].strip()
+            alias_raw = row[alias_i].strip() if alias_i is not None and alias_i < len(row) else ""
             if not name or not raw: continue
-            number = re.sub(r"[^\d+]", "", raw)
-            name_l = _norm(name)
-            out.append({
-                "name": name,
-                "number": number,
-                "alias": alias_raw,
-                "name_l": name_l,
-                "first_l": name_l.split()[0] if name_l else "",
-                "last_l":  name_l.split()[-1] if name_l else "",
-                "inits":   _initials(name_l),
-                "aliases": [a.lower() for a in re.split(r"[,\s;/]+", alias_raw) if a.strip()] if alias_raw else [],
-            })
+            number = NUMBER_CLEAN_RE.sub("", raw)
+            out.append(make_contact(name, number, alias_raw))
     return out
 
-def write_csv_no_backup(csv_path: Path, rows: List[Dict]):
+def write_csv_no_backup(csv_path: Path, rows: List[Contact]):
     tmp = csv_path.with_suffix(csv_path.suffix + ".tmp")
     with open(tmp, "w", newline="") as f:
         w = csv.DictWriter(f, fieldnames=["name","number","alias"])
         w.writeheader()
-        for r in sorted(rows, key=lambda r: r["name"].lower()):
-            w.writerow({"name": r["name"], "number": r["number"], "alias": r.get("alias","")})
+        # same order as core.write_contacts, so rows don't move around
+        # depending on which tool wrote the file last
+        for r in sorted(rows, key=attrgetter("sort_key")):
+            w.writerow({"name": r.name, "number": r.number, "alias": r.alias})
         f.flush(); os.fsync(f.fileno())
     os.replace(tmp, csv_path)
 
@@ -149,64 +213,111 @@ def write_csv_no_backup(csv_path: Path, rows: List[Dict]):
 def print_header(title_left: str, csv_name: str):
     print(f"{HDR}List:{RST} {title_left}  {META}|{RST}  {HDR}CSV:{RST} {csv_name}")
 
-def print_table(rows: List[Dict], caption: str):
+def print_table(rows: List[Contact], caption: str):
     print(f"{META}{caption}{RST}")
     if not rows:
         print(f"{META}(none){RST}")
         return
     idx_w = len(str(len(rows)))
-    name_w = max(len(r["name"]) for r in rows)
-    num_w  = max(len(r["number"]) for r in rows)
+    name_w = max(len(r.name) for r in rows)
+    num_w  = max(len(r.number) for r in rows)
     print(f"{META} {'#'.rjust(idx_w)}  {'Name'.ljust(name_w)}  {'Number'.rjust(num_w)} {RST}")
     for i, r in enumerate(rows, 1):
         idx  = str(i).rjust(idx_w)
-        name = r["name"].ljust(name_w)
-        num  = r["number"].rjust(num_w)
+        name = r.name.ljust(name_w)
+        num  = r.number.rjust(num_w)
         print(f" {DIM}{idx}{RST}  {BOLD}{NAME}{name}{RST}  {NUM}{num}{RST}")
 
 # ---------- matching ----------
-def score_match(tok: str, c: Dict) -> Tuple[int,int]:
-    t = _norm(tok)
+def score_match(tok: str, c: Contact) -> Tuple[int,int]:
+    return score_match_pre(normalize_name(tok), c)
+
+def score_match_pre(t: str, c: Contact) -> Tuple[int,int]:
+    """Same as score_match, for a token that is already normalized."""
     if not t: return (-1, 0)
-    if t in c["aliases"]:                              return (100, len(c["name"]))
-    if t == c["name_l"]:                               return (95, len(c["name"]))
-    if t == c["first_l"] or t == c["last_l"]:          return (90, len(c["name"]))
-    if len(t) <= 3 and t == c["inits"]:                return (85, len(c["name"]))
-    if any(p.startswith(t) for p in c["name_l"].split()): return (70, len(c["name"]))
-    if t in c["name_l"]:                               return (50, len(c["name"]))
+    if t in c.aliases:                                 return (100, len(c.name))
+    if t == c.name_l:                                  return (95, len(c.name))
+    if t == c.first_l or t == c.last_l:                return (90, len(c.name))
+    if len(t) <= 3 and t == c.inits:                   return (85, len(c.name))
+    if any(p.startswith(t) for p in c.name_parts):     return (70, len(c.name))
+    if t in c.name_l:                                  return (50, len(c.name))
     return (-1, 0)
 
-def resolve_tokens(tokens: List[str], people: List[Dict]) -> Tuple[List[Dict], List[str]]:
+def _best_match(t: str, people: List[Contact]) -> Tuple[Optional[Contact], Tuple[int, int]]:
+    if not people:
+        return None, (-1, 0)
+    scored = [(score_match_pre(t, c), c) for c in people]
+    # max() keeps the first of equal scores, same as the old strict > scan
+    best_sc, best = max(scored, key=itemgetter(0))
+    return best, best_sc
+
+def _build_index(people: List[Contact]) -> _Index:
+    exact: Dict[str, List[int]] = {}
+    for i, c in enumerate(people):
+        keys = {c.name_l, *c.aliases}
+        if c.inits and len(c.inits) <= 3:
+            keys.add(c.inits)
+        for k in keys:
+            exact.setdefault(k, []).append(i)
+    pairs = sorted((p, i) for i, c in enumerate(people) for p in c.name_parts)
+    return exact, [p for p, _ in pairs], [i for _, i in pairs]
+
+def _candidates(t: str, index: _Index) -> List[int]:
+    """Roster positions of every contact t can score 70 or more against."""
+    exact, words, owners = index
+    hits = set(exact.get(t, ()))
+    # every word starting with t sits in one contiguous run of the sorted list
+    pos = end = bisect.bisect_left(words, t)
+    while end < len(words) and words[end].startswith(t):
+        end += 1
+    hits.update(owners[pos:end])
+    return sorted(hits)
+
+def resolve_tokens(tokens: List[str], people: List[Contact],
+                   index: Optional[_Index] = None) -> Tuple[List[Contact], List[str]]:
+    if index is None:
+        index = _build_index(people)
     chosen, missing = [], []
     seen_numbers = set()
     for tok in tokens:
-        best, best_sc = None, (-1, 0)
-        for c in people:
-            sc = score_match(tok, c)
-            if sc > best_sc:
-                best_sc, best = sc, c
+        t = sys.intern(normalize_name(tok))
+        # anyone outside the candidates can only be a bare substring hit (50), so
+        # they are scanned for only when no candidate exists; candidates stay in
+        # roster order, keeping the first-of-equal-scores pick the same
+        cand = _candidates(t, index) if t else []
+        best, best_sc = _best_match(t, [people[i] for i in cand] if cand else people)
         if best_sc[0] < 0:
             missing.append(tok)
         else:
-            if best["number"] not in seen_numbers:
-                seen_numbers.add(best["number"])
+            if best.number not in seen_numbers:
+                seen_numbers.add(best.number)
                 chosen.append(best)
     return chosen, missing
 
 # ---------- readline autocomplete ----------
-def setup_readline(people: List[Dict]):
+def setup_readline(people: List[Contact]):
     try:
         cands = []
         for r in people:
-            cands.append(r["name"]); cands.extend(r["aliases"])
+            cands.append(r.name); cands.extend(r.aliases)
         cands = sorted(set(cands), key=str.lower)
         class NameCompleter:
-            def __init__(self, c): self.c=c
+            def __init__(self, c):
+                # c is sorted by str.lower, so keys is sorted and every match
+                # for a prefix sits in one contiguous run found by bisect
+                self.c, self.keys = c, [x.lower() for x in c]
+                self._last_pref, self._last_matches = None, []
             def complete(self, text, state):
                 buf = readline.get_line_buffer()
-                parts = re.split(r"[,\s]+", buf.rstrip())
-                pref = parts[-1] if parts else ""
-                m = [x for x in self.c if x.lower().startswith(pref.lower())]
+                parts = _RE_TOKENS.split(buf.rstrip())
+                pref = parts[-1].lower() if parts else ""
+                # readline calls back with state 0, 1, 2, ... for one prefix
+                if pref != self._last_pref:
+                    lo = bisect.bisect_left(self.keys, pref)
+                    hi = lo
+                    while hi < len(self.keys) and self.keys[hi].startswith(pref): hi += 1
+                    self._last_pref, self._last_matches = pref, self.c[lo:hi]
+                m = self._last_matches
                 try: return m[state]
                 except IndexError: return None
         readline.set_completer_delims(" \t\n")
@@ -221,7 +332,7 @@ def setup_readline(people: List[Dict]):
 def action_remove(csv_path: Path):
     # Screen 1: header + input
     _cls()
-    people = load_contacts(csv_path)
+    people, index = load_contacts_indexed(csv_path)
     print_header(csv_path.stem, csv_path.name)
     if not people:
         print(f"{ERR}List is empty; nothing to remove.{RST}"); return
@@ -232,14 +343,14 @@ def action_remove(csv_path: Path):
         line = input(f"{BOLD}Name(s):{RST} ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCanceled."); return
-    tokens = [t for t in re.split(r"[,\s]+", line) if t]
+    tokens = [t for t in _RE_TOKENS.split(line) if t]
     if not tokens: print("No names entered. Canceled."); return
 
-    all_requested = any(_norm(t) == "all" for t in tokens)
+    all_requested = any(normalize_name(t) == "all" for t in tokens)
     if all_requested:
-        chosen, missing = people[:], [t for t in tokens if _norm(t) != "all"]
+        chosen, missing = people[:], [t for t in tokens if normalize_name(t) != "all"]
     else:
-        chosen, missing = resolve_tokens(tokens, people)
+        chosen, missing = resolve_tokens(tokens, people, index)
 
     # Screen 2: preview table
     _cls()
@@ -254,7 +365,7 @@ def action_remove(csv_path: Path):
     n = len(chosen)
     print_header(csv_path.stem, csv_path.name)
     print(f"{WARN}removing {n} person..{RST}")
-    for r in chosen: print(f"  -> {r['name']}")
+    for r in chosen: print(f"  -> {r.name}")
 
     # Screen 4: commit + final summary
     if all_requested:
@@ -270,25 +381,25 @@ def action_remove(csv_path: Path):
         print(f"{OK}removed {n} | 0 left in {csv_path.name}{RST}")
         return
 
-    nums = {c["number"] for c in chosen}
-    remaining = [r for r in people if r["number"] not in nums]
+    nums = {c.number for c in chosen}
+    remaining = [r for r in people if r.number not in nums]
     write_csv_no_backup(csv_path, remaining)
     _cls(); print_header(csv_path.stem, csv_path.name)
     print(f"{OK}removed {n} | {len(remaining)} left in {csv_path.name}{RST}")
 
-def _prompt_one_person(i: int) -> Optional[Dict]:
+def _prompt_one_person(i: int) -> Optional[Contact]:
     try:
         name = input(f"{BOLD}[{i}] Name:{RST} ").strip()
         if not name: return None
         number = input(f"{BOLD}[{i}] Number (+15551234567 or digits):{RST} ").strip()
-        number = re.sub(r"[^\d+]", "", number)
+        number = NUMBER_CLEAN_RE.sub("", number)
         alias  = input(f"{BOLD}[{i}] Alias(es) [optional, comma-separated]:{RST} ").strip().lower()
     except (KeyboardInterrupt, EOFError):
         print("\nCanceled."); return None
     if not number:
         print(f"{ERR}Number is required; entry skipped.{RST}")
         return None
-    return {"name": name, "number": number, "alias": alias}
+    return make_contact(name, number, alias)
 
 def action_add(csv_path: Path):
     # Screen 1: header + how many
@@ -304,14 +415,15 @@ def action_add(csv_path: Path):
     count = 1 if cnt_raw == "" else (int(cnt_raw) if cnt_raw.isdigit() and int(cnt_raw) > 0 else 1)
 
     # Screen 2: prompts per person (stays on same screen while prompting)
-    staged: List[Dict] = []
+    staged: List[Contact] = []
+    taken = {p.number for p in people}
     for i in range(1, count+1):
         ent = _prompt_one_person(i)
         if ent:
-            if any(p["number"] == ent["number"] for p in people) or any(s["number"] == ent["number"] for s in staged):
+            if ent.number in taken:
                 print(f"{WARN}That number already exists; skipped.{RST}")
             else:
-                staged.append(ent)
+                staged.append(ent); taken.add(ent.number)
 
     if not staged:
         print("No valid entries. Canceled."); return
@@ -327,18 +439,10 @@ def action_add(csv_path: Path):
     _cls()
     print_header(csv_path.stem, csv_path.name)
     print(f"{OK}adding {len(staged)} person..{RST}")
-    for s in staged: print(f"  -> {s['name']}")
+    for s in staged: print(f"  -> {s.name}")
 
     # Commit + Screen 5: final summary
-    for s in staged:
-        people.append({
-            "name": s["name"], "number": s["number"], "alias": s["alias"],
-            "name_l": _norm(s["name"]),
-            "first_l": _norm(s["name"]).split()[0] if s["name"] else "",
-            "last_l":  _norm(s["name"]).split()[-1] if s["name"] else "",
-            "inits":   "".join(w[0] for w in _norm(s["name"]).split() if w),
-            "aliases": [a for a in re.split(r"[,\s;/]+", s["alias"]) if a],
-        })
+    people.extend(staged)
     write_csv_no_backup(csv_path, people)
     _cls(); print_header(csv_path.stem, csv_path.name)
     print(f"{OK}added {len(staged)} | {len(people)} left in {csv_path.name}{RST}")
@@ -4,21 +4,188 @@
 from __future__ import annotations
 
 import curses
-import curses.textpad
+import functools
+import os
 import re
-import textwrap
-import time
 import signal
 import sys
+import threading
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, TypeVar
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from engine import core
+if TYPE_CHECKING:
+    from engine import core
 
 BANNER_PATH = Path(__file__).with_name("banner.txt")
+# osascript sends kept in flight at once by send_messages; launches are still
+# spaced SEND_DELAY apart across all of them, so only the process overhead overlaps
+SEND_WORKERS = 4
+SEND_DELAY = 0.6
+LANDING_HINT = "Use ^/v or j/k to navigate, Enter to select, q/esc to quit"
+
+# read once here rather than off the curses module on every call: safe_addstr runs
+# for every span drawn and draw_contact_row once per visible row per repaint
+_CURSES_ERROR = curses.error
+_ROW_ACTIVE, _ROW_NORMAL, _ROW_META = curses.A_REVERSE, curses.A_NORMAL, curses.A_DIM
+
+
+# key code -> text, built once so key dispatch is one dict lookup with no range checks;
+# query chars exclude space, which the pickers use to toggle
+_QUERY_CHARS = {code: chr(code) for code in range(33, 127)}
+
+# shared picker keys -> action, so each loop dispatches with one dict lookup
+_NAV = {
+    curses.KEY_UP: "up",
+    ord("k"): "up",
+    curses.KEY_DOWN: "down",
+    ord("j"): "down",
+    10: "enter",
+    13: "enter",
+    27: "esc",
+    curses.KEY_BACKSPACE: "back",
+    127: "back",
+    8: "back",
+    ord(" "): "toggle",
+    curses.KEY_RESIZE: "resize",
+}
+
+T = TypeVar("T")
+
+
+# runs of spaces between words; split() keeps them so wrapping can too
+_WRAP_GAP_RE = re.compile(r"( +)")
+
+
+@functools.lru_cache(maxsize=128)
+def _hard_wrap(text: str, width: int) -> tuple[str, ...]:
+    # greedy wrap for monospace output; words wider than a line are split.
+    # spacing between words is kept as typed, so the preview shows what is sent;
+    # only the run a line breaks at is dropped. cached: the same bodies and
+    # preview lines come back at the same widths
+    width = max(1, width)
+    if "\t" in text:
+        text = text.expandtabs()
+    lines: list[str] = []
+    line = ""
+    gap = ""
+    for i, word in enumerate(_WRAP_GAP_RE.split(text)):
+        if i % 2:
+            gap = word
+            continue
+        while len(word) > width:
+            if line:
+                lines.append(line)
+                line = ""
+            lines.append(word[:width])
+            word = word[width:]
+        if not word:
+            continue
+        if not line:
+            line = word
+        elif len(line) + len(gap) + len(word) <= width:
+            line += gap + word
+        else:
+            lines.append(line)
+            line = word
+    if line:
+        lines.append(line)
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=64)
+def _spaces(n: int) -> str:
+    # blank runs for clearing rows; only a handful of widths ever occur
+    return " " * n
+
+
+@functools.lru_cache(maxsize=1)
+def _load_banner() -> tuple[tuple[str, ...], int, int]:
+    # (lines, width, height), read and measured once per process. one open, no
+    # exists() stat first; the art is small, so anything past 4 KiB is ignored
+    try:
+        with BANNER_PATH.open("r") as f:
+            lines = f.read(4096).splitlines()
+    except FileNotFoundError:
+        lines = ["fimg"]
+    # trailing blank lines would only push the menu down
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return tuple(lines), max((len(line) for line in lines), default=0), len(lines)
+
+
+@functools.lru_cache(maxsize=1024)
+def _contact_row_text(
+    name: str, number: str, aliases: tuple[str, ...], width: int, marker: str
+) -> tuple[str, int, int]:
+    # (whole row text, meta column, meta length); highlight only changes attrs
+    inner = max(0, width - len(marker))
+    name_w = min(max(8, min(26, inner // 2)), inner)
+    meta_w = max(0, inner - name_w - 1)
+    meta_parts = [number]
+    if aliases:
+        meta_parts.append(",".join(aliases))
+    meta = " | ".join([p for p in meta_parts if p])[:meta_w]
+    head = f"{marker}{name[:name_w].ljust(name_w)}"
+    if not meta:
+        return head, 0, 0
+    return f"{head} {meta}", len(head) + 1, len(meta)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fuzzy_score(needle: str, hay: str) -> int | None:
+    # both sides arrive casefolded. pure in (needle, hay): backspacing to an
+    # earlier query rescans hays already scored, so those come from the cache
+    if not needle:
+        return 0
+    score = 0
+    last = -1
+    for ch in needle:
+        idx = hay.find(ch, last + 1)
+        if idx == -1:
+            return None
+        score += 3 if idx == last + 1 else 1
+        if idx == 0:
+            score += 2
+        last = idx
+    if needle in hay:
+        score += 4 + len(needle)
+    return score
+
+
+def _charmask(text: str) -> int:
+    # bit n set when ASCII code n occurs in text; other chars are left out, so
+    # a mask test can only ever skip hays that really lack a needle char
+    mask = 0
+    for ch in set(text):
+        code = ord(ch)
+        if code < 128:
+            mask |= 1 << code
+    return mask
+
+
+def _score_pool(
+    parts: list[str], pool: list[tuple[T, str, int]]
+) -> list[tuple[int, tuple[T, str, int]]]:
+    # one pass over (item, casefolded hay, charmask) entries with the scorer bound
+    # locally; matches come back as (score, entry) in pool order
+    score_one = _fuzzy_score
+    need = _charmask("".join(parts))
+    matched = []
+    for entry in pool:
+        if need & ~entry[2]:
+            # some needle char never occurs in the hay: no subsequence match
+            continue
+        hay = entry[1]
+        total = 0
+        for part in parts:
+            score = score_one(part, hay)
+            if score is None:
+                break
+            total += score
+        else:
+            matched.append((total, entry))
+    return matched
 
 
 class TuiApp:
@@ -33,28 +200,49 @@ class TuiApp:
             ("Help", "h", self.show_help),
             ("Quit", "q", self.quit_app),
         ]
-        self.banner_lines = self._load_banner()
+        self.banner_lines, self._banner_w, self._banner_h = _load_banner()
+        # menu never changes at runtime; format and measure it once
+        self._menu_lines = [f"{label:<10} {hotkey}" for label, hotkey, _ in self.menu_items]
+        self._menu_w = max((len(line) for line in self._menu_lines), default=0)
+        # key code of either case of a hotkey -> (label, action), so a keystroke
+        # dispatches on the raw getch value; the first item wins a clash ("s" vs "S")
+        self._hotkeys: dict[int, tuple[str, Callable[[], None]]] = {}
+        for label, hotkey, action in self.menu_items:
+            for key in (hotkey.lower(), hotkey.upper()):
+                self._hotkeys.setdefault(ord(key), (label, action))
         self.running = True
         self.needs_redraw = False
         self.overlay_rect: tuple[int, int, int, int] | None = None
-
-    def _load_banner(self) -> list[str]:
-        if not BANNER_PATH.exists():
-            return ["fimg"]
-        return BANNER_PATH.read_text().splitlines()
+        # labels of the menu actions currently on screen; resize repaints the top one
+        self._modal_stack: list[str] = []
+        # (menu_top, menu_left) of the last full landing paint, None when stale
+        self._landing_menu_pos: tuple[int, int] | None = None
+        # (lists dir mtime_ns, core.list_entries() result); see entries()
+        self._entries_cache: tuple[int | None, list[tuple[str, Path]]] | None = None
+        # (rows, cols) -> (banner top, banner left, menu top, menu left, hint left)
+        self._landing_geometry: dict[tuple[int, int], tuple[int, int, int, int, int]] = {}
 
     def init_screen(self) -> None:
         curses.curs_set(0)
         curses.noecho()
         curses.cbreak()
         self.stdscr.keypad(True)
-        self.stdscr.nodelay(True)
+        # block in getch(); read_key turns the SIGWINCH interruption into KEY_RESIZE
+        self.stdscr.timeout(-1)
+        # the cursor is hidden outside text inputs, so don't spend bytes parking it
+        self.stdscr.leaveok(True)
+        # don't poll stdin mid-update: held keys are coalesced by the loops
+        # themselves, and the poll costs a syscall per chunk of output
+        curses.typeahead(-1)
         if hasattr(curses, "set_escdelay"):
             curses.set_escdelay(25)
         if curses.has_colors():
             curses.start_color()
             curses.use_default_colors()
         signal.signal(signal.SIGWINCH, self._on_resize)
+        # read_key relies on the signal cutting a blocked getch short; make that
+        # explicit rather than leaning on signal.signal's default of no SA_RESTART
+        signal.siginterrupt(signal.SIGWINCH, True)
 
     def _on_resize(self, _signum: int, _frame: object) -> None:
         self.needs_redraw = True
@@ -72,7 +260,7 @@ class TuiApp:
                 win.addstr(y, x, text, attr)
             else:
                 win.addstr(y, x, text)
-        except curses.error:
+        except _CURSES_ERROR:
             pass
 
     def set_cursor(self, visible: bool) -> None:
@@ -81,12 +269,49 @@ class TuiApp:
         except curses.error:
             pass
 
+    def _flush(self) -> None:
+        # push every window staged with noutrefresh() to the terminal in one burst
+        curses.doupdate()
+
+    def read_key(self, win: "curses._CursesWindow") -> int:
+        # our SIGWINCH handler replaces ncurses' own, so a resize shows up as an
+        # interrupted getch (-1), or not at all if it landed while we were drawing;
+        # report it as KEY_RESIZE so every loop's resize branch picks it up
+        if self.needs_redraw:
+            return curses.KEY_RESIZE
+        ch = win.getch()
+        if ch == -1 and self.needs_redraw:
+            return curses.KEY_RESIZE
+        return ch
+
+    def _coalesce_nav(self, win: "curses._CursesWindow", idx: int, last: int) -> int:
+        # fold any up/down keys already queued (held arrow key) into one move;
+        # the first other key goes back on the queue for the normal handler
+        win.nodelay(True)
+        try:
+            while True:
+                ch = self.read_key(win)
+                if ch == -1:
+                    break
+                action = _NAV.get(ch)
+                if action == "up":
+                    idx = max(0, idx - 1)
+                elif action == "down":
+                    idx = min(last, idx + 1)
+                else:
+                    curses.ungetch(ch)
+                    break
+        finally:
+            win.nodelay(False)
+        return idx
+
     def draw_scrim(self) -> None:
-        rows, cols = self.stdscr.getmaxyx()
-        fill = " " * max(0, cols - 1)
-        for y in range(rows):
-            self.safe_addstr(self.stdscr, y, 0, fill, curses.A_DIM)
-        self.stdscr.refresh()
+        # erase() fills every cell with the background, so a dim background
+        # paints the whole scrim in one call instead of one addstr per row
+        self._landing_menu_pos = None
+        self.stdscr.bkgdset(" ", curses.A_DIM)
+        self.stdscr.erase()
+        self.stdscr.bkgdset(" ", curses.A_NORMAL)
 
     def draw_overlay_footer(self, text: str) -> None:
         if not text or not self.overlay_rect:
@@ -100,31 +325,35 @@ class TuiApp:
         if inner_w <= 0:
             return
         label = text[:inner_w]
-        pad = " " * (inner_w - len(label))
+        pad = _spaces(inner_w - len(label))
         self.safe_addstr(self.stdscr, footer_y, left + 2, label + pad, curses.A_DIM)
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
 
     def handle_resize(self) -> None:
+        # ncurses only rereads the tty size from its own SIGWINCH handler, which
+        # ours replaces, so hand it the new size explicitly
         try:
-            curses.resize_term(0, 0)
-        except curses.error:
+            size = os.get_terminal_size(sys.stdout.fileno())
+            curses.resize_term(size.lines, size.columns)
+        except (OSError, ValueError, curses.error):
             pass
+        # one repaint however many SIGWINCHs piled up; clear() only flags the
+        # wipe, which rides along with the next flush instead of its own write
+        self.needs_redraw = False
         self.stdscr.clear()
-        self.stdscr.refresh()
+        self._landing_menu_pos = None
         curses.flushinp()
-        self.draw_landing()
+        if not self._modal_stack:
+            self.draw_landing()
+        # otherwise the open modal rebuilds its overlay on the new geometry
 
     def run(self) -> None:
         self.init_screen()
         self.draw_landing()
         try:
             while self.running:
-                if self.needs_redraw:
-                    self.needs_redraw = False
-                    self.handle_resize()
-                ch = self.stdscr.getch()
+                ch = self.read_key(self.stdscr)
                 if ch == -1:
-                    time.sleep(0.05)
                     continue
                 if ch == curses.KEY_RESIZE:
                     self.handle_resize()
@@ -132,79 +361,101 @@ class TuiApp:
                 if ch == 27:
                     self.quit_app()
                     continue
-                if ch in (curses.KEY_UP, ord("k")):
-                    self.menu_idx = max(0, self.menu_idx - 1)
-                    self.draw_landing()
-                    continue
-                if ch in (curses.KEY_DOWN, ord("j")):
-                    self.menu_idx = min(len(self.menu_items) - 1, self.menu_idx + 1)
-                    self.draw_landing()
+                if ch in (curses.KEY_UP, ord("k"), curses.KEY_DOWN, ord("j")):
+                    last = len(self.menu_items) - 1
+                    step = -1 if ch in (curses.KEY_UP, ord("k")) else 1
+                    idx = min(last, max(0, self.menu_idx + step))
+                    self.move_menu(self._coalesce_nav(self.stdscr, idx, last))
                     continue
 
                 if ch in (10, 13):
-                    _, _, action = self.menu_items[self.menu_idx]
-                    action()
-                    self.draw_landing()
+                    label, _, action = self.menu_items[self.menu_idx]
+                    self.open_modal(label, action)
                     continue
 
-                key = chr(ch).lower() if 0 <= ch < 256 else ""
-                for _label, hotkey, action in self.menu_items:
-                    if key == hotkey.lower():
-                        action()
-                        self.draw_landing()
-                        break
+                hit = self._hotkeys.get(ch)
+                if hit is not None:
+                    self.open_modal(*hit)
         except KeyboardInterrupt:
             self.running = False
 
+    def open_modal(self, label: str, action: Callable[[], None]) -> None:
+        self._modal_stack.append(label)
+        try:
+            action()
+        finally:
+            self._modal_stack.pop()
+        # only repaint if something covered the landing; quitting draws nothing
+        if self._landing_menu_pos is None:
+            self.draw_landing()
+
     def draw_landing(self) -> None:
-        self.stdscr.clear()
+        # erase() rather than clear(): curses still diffs against the screen,
+        # so only cells that actually changed are sent to the terminal
+        self.stdscr.erase()
+        self._landing_menu_pos = None
         rows, cols = self.stdscr.getmaxyx()
         if rows < 24 or cols < 80:
             msg = "Resize terminal to at least 80x24."
             self.safe_addstr(self.stdscr, rows // 2, max(0, (cols - len(msg)) // 2), msg)
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            self._flush()
             return
 
-        banner_w = max((len(line) for line in self.banner_lines), default=0)
-        banner_h = len(self.banner_lines)
-        menu_h = len(self.menu_items)
-        menu_w = max((len(f"{label:<10} {hotkey}") for label, hotkey, _ in self.menu_items), default=0)
-        gap = 2
-        total_h = banner_h + gap + menu_h
-        top = max(0, (rows - total_h) // 2)
-        menu_left = max(0, (cols - menu_w) // 2)
-        left = max(0, menu_left + (menu_w - banner_w) // 2)
+        geometry = self._landing_geometry.get((rows, cols))
+        if geometry is None:
+            gap = 2
+            total_h = self._banner_h + gap + len(self.menu_items)
+            top = max(0, (rows - total_h) // 2)
+            menu_left = max(0, (cols - self._menu_w) // 2)
+            left = max(0, menu_left + (self._menu_w - self._banner_w) // 2)
+            hint_left = max(0, (cols - len(LANDING_HINT)) // 2)
+            geometry = (top, left, top + self._banner_h + gap, menu_left, hint_left)
+            self._landing_geometry[(rows, cols)] = geometry
+        top, left, menu_top, menu_left, hint_left = geometry
         for i, line in enumerate(self.banner_lines):
             self.safe_addstr(self.stdscr, top + i, left, line)
 
-        menu_top = top + banner_h + gap
-        for i, (label, hotkey, _) in enumerate(self.menu_items):
-            line = f"{label:<10} {hotkey}"
-            if i == self.menu_idx:
-                self.safe_addstr(self.stdscr, menu_top + i, menu_left, line, curses.A_REVERSE)
-            else:
-                self.safe_addstr(self.stdscr, menu_top + i, menu_left, line)
-
-        hint = "Use ^/v or j/k to navigate, Enter to select, q/esc to quit"
-        self.safe_addstr(
-            self.stdscr,
-            rows - 2,
-            max(0, (cols - len(hint)) // 2),
-            hint,
-            curses.A_DIM,
-        )
-        self.stdscr.refresh()
+        for i in range(len(self.menu_items)):
+            self.draw_menu_row(menu_top, menu_left, i)
+        self._landing_menu_pos = (menu_top, menu_left)
+
+        self.safe_addstr(self.stdscr, rows - 2, hint_left, LANDING_HINT, curses.A_DIM)
+        self.stdscr.noutrefresh()
+        self._flush()
+
+    def draw_menu_row(self, menu_top: int, menu_left: int, i: int) -> None:
+        attr = curses.A_REVERSE if i == self.menu_idx else curses.A_NORMAL
+        self.safe_addstr(self.stdscr, menu_top + i, menu_left, self._menu_lines[i], attr)
+
+    def move_menu(self, new_idx: int) -> None:
+        old_idx, self.menu_idx = self.menu_idx, new_idx
+        if self._landing_menu_pos is None:
+            self.draw_landing()
+            return
+        if old_idx == new_idx:
+            return
+        # only the old and new highlight rows change
+        menu_top, menu_left = self._landing_menu_pos
+        self.draw_menu_row(menu_top, menu_left, old_idx)
+        self.draw_menu_row(menu_top, menu_left, new_idx)
+        self.stdscr.noutrefresh()
+        self._flush()
 
     def draw_shadow(self, top: int, left: int, height: int, width: int) -> None:
         rows, cols = self.stdscr.getmaxyx()
-        shadow_attr = curses.A_DIM
-        if left + width < cols:
-            for r in range(top + 1, min(top + height + 1, rows)):
-                self.safe_addstr(self.stdscr, r, left + width, " ", shadow_attr)
-        if top + height < rows:
-            shadow_w = min(width - 1, cols - left - 1)
-            if shadow_w > 0:
-                self.safe_addstr(self.stdscr, top + height, left + 1, " " * shadow_w, shadow_attr)
+        shadow_ch = ord(" ") | curses.A_DIM
+        try:
+            if left + width < cols:
+                shadow_h = min(top + height + 1, rows) - (top + 1)
+                if shadow_h > 0:
+                    self.stdscr.vline(top + 1, left + width, shadow_ch, shadow_h)
+            if top + height < rows:
+                shadow_w = min(width - 1, cols - left - 1)
+                if shadow_w > 0:
+                    self.stdscr.hline(top + height, left + 1, shadow_ch, shadow_w)
+        except curses.error:
+            pass
 
     def make_overlay(self, height: int, width: int, title: str) -> "curses._CursesWindow":
         rows, cols = self.stdscr.getmaxyx()
@@ -215,42 +466,86 @@ class TuiApp:
         self.overlay_rect = (top, left, height, width)
         self.draw_scrim()
         self.draw_shadow(top, left, height, width)
+        self.stdscr.noutrefresh()
         win = curses.newwin(height, width, top, left)
         win.box()
         if title:
             self.safe_addstr(win, 0, 2, f" {title} ")
         win.keypad(True)
-        win.refresh()
+        win.leaveok(True)
+        # staged only; the caller's first flush sends scrim, shadow and box in one burst
+        win.noutrefresh()
         return win
 
+    def restage_overlay(self, win: "curses._CursesWindow") -> None:
+        # a resize that left the size alone: handle_resize wiped stdscr, so put
+        # scrim and shadow back and resend the existing window as it is
+        top, left, height, width = win.getbegyx() + win.getmaxyx()
+        self.overlay_rect = (top, left, height, width)
+        self.draw_scrim()
+        self.draw_shadow(top, left, height, width)
+        self.stdscr.noutrefresh()
+        win.touchwin()
+        win.noutrefresh()
+
     def input_line(self, win: "curses._CursesWindow", y: int, x: int, max_len: int, initial: str = "") -> str | None:
         self.set_cursor(True)
+        win.leaveok(False)
         try:
-            buf = list(initial[:max_len])
+            # typed input is printable ASCII, so bytes and columns line up
+            buf = bytearray(initial[:max_len].encode("utf-8"))
             pos = len(buf)
-            self.safe_addstr(win, y, x, "".join(buf))
+            last_x = win.getmaxyx()[1] - 1
+
+            def park() -> None:
+                # a full field ends on the window's last column; keep the cursor on it
+                try:
+                    win.move(y, min(x + pos, last_x))
+                except curses.error:
+                    pass
+
+            self.safe_addstr(win, y, x, buf.decode("utf-8"))
+            park()
             while True:
-                win.move(y, x + pos)
-                win.refresh()
-                ch = win.getch()
+                # getch refreshes the window (and parks the cursor) if anything changed
+                ch = self.read_key(win)
                 if ch == curses.KEY_RESIZE:
                     self.handle_resize()
                     return None
                 if ch in (10, 13):
-                    return "".join(buf).strip()
+                    return buf.decode("utf-8").strip()
                 if ch == 27:
                     return None
                 if ch in (curses.KEY_BACKSPACE, 127, 8):
                     if pos > 0:
                         pos -= 1
-                        buf.pop()
+                        del buf[-1]
                         self.safe_addstr(win, y, x + pos, " ")
+                        park()
                     continue
                 if 32 <= ch < 127 and pos < max_len:
-                    buf.append(chr(ch))
-                    self.safe_addstr(win, y, x + pos, chr(ch))
+                    # drain whatever else is already queued (a paste) and echo it in one write
+                    start = pos
+                    buf.append(ch)
                     pos += 1
+                    win.nodelay(True)
+                    try:
+                        while pos < max_len:
+                            nx = win.getch()
+                            if nx == -1:
+                                break
+                            if not 32 <= nx < 127:
+                                curses.ungetch(nx)
+                                break
+                            buf.append(nx)
+                            pos += 1
+                    finally:
+                        win.nodelay(False)
+                    # safe_addstr: text reaching the bottom-right cell makes curses raise
+                    self.safe_addstr(win, y, x + start, buf[start:].decode("utf-8"))
+                    park()
         finally:
+            win.leaveok(True)
             self.set_cursor(False)
 
     def input_multiline(self, title: str, initial: str = "") -> str | None:
@@ -259,66 +554,96 @@ class TuiApp:
         width = min(72, cols - 6)
         win = self.make_overlay(height, width, title)
         self.draw_overlay_footer("Ctrl+D finish | Esc cancel")
+        self._flush()
         edit_h = height - 4
         edit_w = width - 4
         edit_win = win.derwin(edit_h, edit_w, 2, 2)
-        if initial:
-            for i, line in enumerate(initial.splitlines()[:edit_h]):
-                self.safe_addstr(edit_win, i, 0, line[:edit_w - 1])
-
-        canceled = {"flag": False}
-
-        def validator(ch: int) -> int:
-            if ch == 27:
-                canceled["flag"] = True
-                return 7
-            if ch == curses.KEY_RESIZE:
-                canceled["flag"] = True
-                self.handle_resize()
-                return 7
-            if ch == 4:
-                return 7
-            return ch
-
-        box = curses.textpad.Textbox(edit_win)
+        edit_win.keypad(True)
+        edit_win.leaveok(False)
+        # one bytearray per line (printable ASCII, like input_line); typing past a
+        # full line carries on below it
+        buf = [bytearray(line[:edit_w].encode("utf-8")) for line in initial.splitlines()[:edit_h]] or [bytearray()]
+        cy = len(buf) - 1
+        cx = len(buf[cy])
+
+        def paint(first: int) -> None:
+            # repaint rows from `first` down; rows past the text are blanked
+            for y in range(first, edit_h):
+                text = buf[y].decode("utf-8") if y < len(buf) else ""
+                self.safe_addstr(edit_win, y, 0, text.ljust(edit_w))
+
+        paint(0)
         self.set_cursor(True)
         try:
-            text = box.edit(validator)
+            while True:
+                # a full line has no cell past its end; park on its last char instead
+                edit_win.move(cy, min(cx, edit_w - 1))
+                ch = self.read_key(edit_win)
+                if ch == curses.KEY_RESIZE:
+                    self.handle_resize()
+                    return None
+                if ch == 27:
+                    return None
+                if ch in (4, 7):
+                    break
+                line = buf[cy]
+                if ch in (10, 13, curses.KEY_ENTER):
+                    if len(buf) < edit_h:
+                        buf.insert(cy + 1, line[cx:])
+                        del line[cx:]
+                        cy += 1
+                        cx = 0
+                        paint(cy - 1)
+                elif ch in (curses.KEY_BACKSPACE, 127, 8):
+                    if cx > 0:
+                        cx -= 1
+                        del line[cx]
+                        self.safe_addstr(edit_win, cy, 0, line.decode("utf-8").ljust(edit_w))
+                    elif cy > 0 and len(buf[cy - 1]) + len(line) <= edit_w:
+                        cy -= 1
+                        cx = len(buf[cy])
+                        buf[cy].extend(buf.pop(cy + 1))
+                        paint(cy)
+                elif ch == curses.KEY_LEFT:
+                    if cx > 0:
+                        cx -= 1
+                    elif cy > 0:
+                        cy -= 1
+                        cx = len(buf[cy])
+                elif ch == curses.KEY_RIGHT:
+                    if cx < len(line):
+                        cx += 1
+                    elif cy < len(buf) - 1:
+                        cy += 1
+                        cx = 0
+                elif ch == curses.KEY_UP:
+                    if cy > 0:
+                        cy -= 1
+                        cx = min(cx, len(buf[cy]))
+                elif ch == curses.KEY_DOWN:
+                    if cy < len(buf) - 1:
+                        cy += 1
+                        cx = min(cx, len(buf[cy]))
+                elif 32 <= ch < 127:
+                    if len(line) >= edit_w and cx == len(line) and len(buf) < edit_h:
+                        # full line: carry on typing on a fresh one
+                        buf.insert(cy + 1, bytearray())
+                        cy += 1
+                        cx = 0
+                        line = buf[cy]
+                        paint(cy)
+                    if len(line) < edit_w:
+                        line.insert(cx, ch)
+                        cx += 1
+                        # only the edited row changes
+                        self.safe_addstr(edit_win, cy, 0, line.decode("utf-8").ljust(edit_w))
         finally:
             self.set_cursor(False)
-        if canceled["flag"]:
-            return None
-        return text.strip()
-
-    def fuzzy_score(self, needle: str, hay: str) -> int | None:
-        if not needle:
-            return 0
-        needle = needle.lower()
-        hay = hay.lower()
-        score = 0
-        last = -1
-        for ch in needle:
-            idx = hay.find(ch, last + 1)
-            if idx == -1:
-                return None
-            score += 3 if idx == last + 1 else 1
-            if idx == 0:
-                score += 2
-            last = idx
-        if needle in hay:
-            score += 4 + len(needle)
-        return score
-
-    def fuzzy_match_score(self, query: str, hay: str) -> int | None:
-        if not query:
-            return 0
-        total = 0
-        for part in query.lower().split():
-            score = self.fuzzy_score(part, hay)
-            if score is None:
-                return None
-            total += score
-        return total
+        return b"\n".join(line.rstrip() for line in buf).decode("utf-8").strip()
+
+    def query_parts(self, query: str) -> list[str]:
+        # longest term first: it is the likeliest to miss, so non-matches bail early
+        return sorted(query.casefold().split(), key=len, reverse=True)
 
     def draw_contact_row(
         self,
@@ -334,20 +659,15 @@ class TuiApp:
         marker = ""
         if show_marker:
             marker = "[x] " if selected else "[ ] "
-        inner = max(0, width - len(marker))
-        name_w = min(max(8, min(26, inner // 2)), inner)
-        meta_w = max(0, inner - name_w - 1)
-        name_part = contact.name[:name_w].ljust(name_w)
-        meta_parts = [contact.number]
-        if contact.aliases:
-            meta_parts.append(",".join(contact.aliases))
-        meta = " | ".join([p for p in meta_parts if p])
-        meta_part = meta[:meta_w]
-        row_attr = curses.A_REVERSE if active else curses.A_NORMAL
-        meta_attr = row_attr | curses.A_DIM
-        self.safe_addstr(win, y, x, f"{marker}{name_part}", row_attr)
-        if meta_part:
-            self.safe_addstr(win, y, x + len(marker) + name_w + 1, meta_part, meta_attr)
+        text, meta_x, meta_len = _contact_row_text(contact.name, contact.number, contact.aliases, width, marker)
+        row_attr = _ROW_ACTIVE if active else _ROW_NORMAL
+        # one write for the row, then dim the meta span in place
+        self.safe_addstr(win, y, x, text, row_attr)
+        if meta_len:
+            try:
+                win.chgat(y, x + meta_x, meta_len, row_attr | _ROW_META)
+            except _CURSES_ERROR:
+                pass
 
     def contact_browser(
         self,
@@ -358,31 +678,79 @@ class TuiApp:
         query = ""
         idx = 0
         offset = 0
-        selected_numbers: set[str] = set()
-        sorted_contacts = sorted(contacts, key=lambda c: c.name.lower())
+        # number -> contact, so confirming reads the picks back without a rescan
+        selected: dict[str, core.Contact] = {}
+        # callers that load via core.load_contacts_sorted hand us an already ordered
+        # list, which sorted() confirms in a single linear pass
+        sorted_contacts = sorted(contacts, key=attrgetter("sort_key"))
+        # search text comes casefolded with each contact from core, so only the
+        # masks are built here
+        haystacks = [
+            (contact, contact.search_key, _charmask(contact.search_key)) for contact in sorted_contacts
+        ]
+        # contacts that can still match: typing only narrows, backspace resets
+        pool = haystacks
+        filtered = sorted_contacts
+        refilter = False
+        footer = "Space toggle | Enter confirm | Esc back" if selectable else "Esc back"
+        win = None
+        height = width = inner_w = max_rows = 0
+        # what the window currently shows; a full paint happens when these go stale
+        drawn_view: tuple[str, int] | None = None
+        drawn_idx = 0
+
+        def draw_header() -> None:
+            self.safe_addstr(win, 1, 1, _spaces(width - 2))
+            filter_label = f"Filter: {query}" if query else "Filter: (type to search)"
+            self.safe_addstr(win, 1, 2, filter_label[:inner_w])
+            right = f"{len(filtered)}/{len(sorted_contacts)}"
+            if selectable:
+                right = f"Selected {len(selected)} | {right}"
+            if len(right) + 1 < inner_w:
+                self.safe_addstr(win, 1, width - 2 - len(right), right, curses.A_DIM)
+
+        def draw_row(pos: int) -> None:
+            contact = filtered[pos]
+            self.draw_contact_row(
+                win,
+                2 + pos - offset,
+                2,
+                inner_w,
+                contact,
+                pos == idx,
+                contact.number in selected,
+                selectable,
+            )
+
+        def draw_markers() -> None:
+            if offset > 0:
+                self.safe_addstr(win, 2, width - 3, "^", curses.A_DIM)
+            if offset + max_rows < len(filtered):
+                self.safe_addstr(win, 2 + max_rows - 1, width - 3, "v", curses.A_DIM)
+
         while True:
-            rows, cols = self.stdscr.getmaxyx()
-            height = min(20, rows - 4)
-            width = min(78, cols - 6)
-            win = self.make_overlay(height, width, title)
-            inner_w = width - 4
-            if query:
-                ranked: list[tuple[int, core.Contact]] = []
-                for contact in sorted_contacts:
-                    hay = " ".join(
-                        [contact.name, contact.number, " ".join(contact.aliases)]
-                    ).lower()
-                    score = self.fuzzy_match_score(query, hay)
-                    if score is None:
-                        continue
-                    ranked.append((score, contact))
-                ranked.sort(key=lambda pair: (-pair[0], pair[1].name.lower()))
-                filtered = [contact for _score, contact in ranked]
-            else:
-                filtered = sorted_contacts
+            if win is None:
+                rows, cols = self.stdscr.getmaxyx()
+                height = min(20, rows - 4)
+                width = min(78, cols - 6)
+                win = self.make_overlay(height, width, title)
+                inner_w = width - 4
+                max_rows = height - 4
+                drawn_view = None
+            if refilter:
+                refilter = False
+                if query:
+                    ranked = _score_pool(self.query_parts(query), pool)
+                    pool = [entry for _score, entry in ranked]
+                    # pool follows sorted_contacts, so a stable sort on score alone
+                    # already breaks ties by name without lowercasing anything
+                    ranked.sort(key=lambda hit: -hit[0])
+                    filtered = [entry[0] for _score, entry in ranked]
+                else:
+                    filtered = sorted_contacts
+                    pool = haystacks
             if idx >= len(filtered):
                 idx = max(0, len(filtered) - 1)
-            max_rows = height - 4
             max_offset = max(0, len(filtered) - max_rows)
             if offset > max_offset:
                 offset = max_offset
@@ -391,74 +759,76 @@ class TuiApp:
             if idx >= offset + max_rows:
                 offset = idx - max_rows + 1
 
-            filter_label = f"Filter: {query}" if query else "Filter: (type to search)"
-            self.safe_addstr(win, 1, 2, filter_label[:inner_w])
-            right = f"{len(filtered)}/{len(sorted_contacts)}"
-            if selectable:
-                right = f"Selected {len(selected_numbers)} | {right}"
-            if len(right) + 1 < inner_w:
-                self.safe_addstr(win, 1, width - 2 - len(right), right, curses.A_DIM)
-
-            if not filtered:
-                self.safe_addstr(win, 3, 2, "No matches.", curses.A_DIM)
+            if drawn_view != (query, offset):
+                draw_header()
+                for y in range(2, 2 + max_rows):
+                    self.safe_addstr(win, y, 1, _spaces(width - 2))
+                if not filtered:
+                    self.safe_addstr(win, 3, 2, "No matches.", curses.A_DIM)
+                else:
+                    for pos in range(offset, min(offset + max_rows, len(filtered))):
+                        draw_row(pos)
+                    draw_markers()
+                win.noutrefresh()
+                self.draw_overlay_footer(footer)
+                drawn_view = (query, offset)
             else:
-                view = filtered[offset : offset + max_rows]
-                for i, contact in enumerate(view):
-                    active = (offset + i) == idx
-                    selected = contact.number in selected_numbers
-                    self.draw_contact_row(
-                        win,
-                        2 + i,
-                        2,
-                        inner_w,
-                        contact,
-                        active,
-                        selected,
-                        selectable,
-                    )
-                if offset > 0:
-                    self.safe_addstr(win, 2, width - 3, "^", curses.A_DIM)
-                if offset + max_rows < len(filtered):
-                    self.safe_addstr(win, 2 + max_rows - 1, width - 3, "v", curses.A_DIM)
-
-            footer = "Esc back"
-            if selectable:
-                footer = "Space toggle | Enter confirm | Esc back"
-            win.refresh()
-            self.draw_overlay_footer(footer)
-            ch = win.getch()
-            if ch == curses.KEY_RESIZE:
+                # same page: repaint the old and new highlight rows plus the counts
+                draw_header()
+                if filtered:
+                    if drawn_idx != idx and drawn_idx < len(filtered):
+                        draw_row(drawn_idx)
+                    draw_row(idx)
+                    draw_markers()
+                win.noutrefresh()
+            drawn_idx = idx
+            self._flush()
+            ch = self.read_key(win)
+            if ch == -1:
+                # interrupted (e.g. SIGWINCH); rebuild the overlay
+                win = None
+                continue
+            action = _NAV.get(ch)
+            if action == "resize":
                 self.handle_resize()
+                win = None
                 continue
-            if ch in (curses.KEY_UP, ord("k")):
-                idx = max(0, idx - 1)
+            if action == "up":
+                idx = self._coalesce_nav(win, max(0, idx - 1), max(0, len(filtered) - 1))
                 continue
-            if ch in (curses.KEY_DOWN, ord("j")):
-                idx = min(max(0, len(filtered) - 1), idx + 1)
+            if action == "down":
+                last = max(0, len(filtered) - 1)
+                idx = self._coalesce_nav(win, min(last, idx + 1), last)
                 continue
-            if ch in (10, 13):
+            if action == "enter":
                 if not selectable:
                     return None
-                if not selected_numbers:
+                if not selected:
                     self.show_message("No selection", "Select at least one contact to remove.")
+                    win = None
                     continue
-                return [c for c in sorted_contacts if c.number in selected_numbers]
-            if ch == 27:
+                return sorted(selected.values(), key=attrgetter("sort_key"))
+            if action == "esc":
                 return None
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
+            if action == "back":
                 query = query[:-1]
+                pool = haystacks
+                refilter = True
                 idx = 0
                 offset = 0
                 continue
-            if ch == ord(" ") and selectable and filtered:
-                contact = filtered[idx]
-                if contact.number in selected_numbers:
-                    selected_numbers.remove(contact.number)
-                else:
-                    selected_numbers.add(contact.number)
+            if action == "toggle":
+                if selectable and filtered:
+                    contact = filtered[idx]
+                    if contact.number in selected:
+                        del selected[contact.number]
+                    else:
+                        selected[contact.number] = contact
                 continue
-            if 32 <= ch < 127 and ch != ord(" "):
-                query += chr(ch)
+            typed = _QUERY_CHARS.get(ch)
+            if typed:
+                query += typed
+                refilter = True
                 idx = 0
                 offset = 0
                 continue
@@ -473,27 +843,75 @@ class TuiApp:
         idx = 0
         offset = 0
         selected: set[str] = set()
+        # casefolded label per entry, built once for the whole session
+        haystacks = []
+        for entry in entries:
+            hay = entry[0].casefold()
+            haystacks.append((entry, hay, _charmask(hay)))
+        # entries that can still match: typing only narrows, backspace resets
+        pool = haystacks
+        filtered = entries
+        refilter = False
+        if multi:
+            footer = "Space toggle | Enter confirm | Esc back"
+        else:
+            footer = "Enter select | Esc back"
+        win = None
+        height = width = inner_w = max_rows = 0
+        # what the window currently shows; a full paint happens when these go stale
+        drawn_view: tuple[str, int] | None = None
+        drawn_idx = 0
+
+        def draw_header() -> None:
+            self.safe_addstr(win, 1, 1, _spaces(width - 2))
+            filter_label = f"Filter: {query}" if query else "Filter: (type to search)"
+            self.safe_addstr(win, 1, 2, filter_label[:inner_w])
+            right = f"{len(filtered)}/{len(entries)}"
+            if multi:
+                right = f"Selected {len(selected)} | {right}"
+            if len(right) + 1 < inner_w:
+                self.safe_addstr(win, 1, width - 2 - len(right), right, curses.A_DIM)
+
+        def draw_row(pos: int) -> None:
+            label = filtered[pos][0]
+            marker = ""
+            if multi:
+                marker = "[x] " if label in selected else "[ ] "
+            line = f"{marker}{label}"[:inner_w]
+            attr = curses.A_REVERSE if pos == idx else curses.A_NORMAL
+            y = 2 + pos - offset
+            # pad with blanks so a shorter label never leaves the old highlight behind
+            self.safe_addstr(win, y, 2, line, attr)
+            self.safe_addstr(win, y, 2 + len(line), _spaces(inner_w - len(line)))
+
+        def draw_markers() -> None:
+            if offset > 0:
+                self.safe_addstr(win, 2, width - 3, "^", curses.A_DIM)
+            if offset + max_rows < len(filtered):
+                self.safe_addstr(win, 2 + max_rows - 1, width - 3, "v", curses.A_DIM)
+
         while True:
-            rows, cols = self.stdscr.getmaxyx()
-            height = min(12, rows - 4)
-            width = min(50, cols - 6)
-            win = self.make_overlay(height, width, title)
-            inner_w = width - 4
-            if query:
-                ranked: list[tuple[int, tuple[str, Path]]] = []
-                for label, path in entries:
-                    score = self.fuzzy_match_score(query, label)
-                    if score is None:
-                        continue
-                    ranked.append((score, (label, path)))
-                ranked.sort(key=lambda pair: (-pair[0], pair[1][0].lower()))
-                filtered = [item for _score, item in ranked]
-            else:
-                filtered = entries
+            if win is None:
+                rows, cols = self.stdscr.getmaxyx()
+                height = min(12, rows - 4)
+                width = min(50, cols - 6)
+                win = self.make_overlay(height, width, title)
+                inner_w = width - 4
+                max_rows = height - 4
+                drawn_view = None
+            if refilter:
+                refilter = False
+                if query:
+                    ranked = _score_pool(self.query_parts(query), pool)
+                    pool = [hay_entry for _score, hay_entry in ranked]
+                    ranked.sort(key=lambda hit: (-hit[0], hit[1][1]))
+                    filtered = [hay_entry[0] for _score, hay_entry in ranked]
+                else:
+                    filtered = entries
+                    pool = haystacks
 
             if idx >= len(filtered):
                 idx = max(0, len(filtered) - 1)
-            max_rows = height - 4
             max_offset = max(0, len(filtered) - max_rows)
             if offset > max_offset:
                 offset = max_offset
@@ -502,48 +920,48 @@ class TuiApp:
             if idx >= offset + max_rows:
                 offset = idx - max_rows + 1
 
-            filter_label = f"Filter: {query}" if query else "Filter: (type to search)"
-            self.safe_addstr(win, 1, 2, filter_label[:inner_w])
-            right = f"{len(filtered)}/{len(entries)}"
-            if multi:
-                right = f"Selected {len(selected)} | {right}"
-            if len(right) + 1 < inner_w:
-                self.safe_addstr(win, 1, width - 2 - len(right), right, curses.A_DIM)
-
-            if not filtered:
-                self.safe_addstr(win, 3, 2, "No matches.", curses.A_DIM)
-            else:
-                view = filtered[offset : offset + max_rows]
-                for i, (label, _path) in enumerate(view):
-                    active = (offset + i) == idx
-                    marker = ""
-                    if multi:
-                        marker = "[x] " if label in selected else "[ ] "
-                    line = f"{marker}{label}"
-                    attr = curses.A_REVERSE if active else curses.A_NORMAL
-                    self.safe_addstr(win, 2 + i, 2, line[:inner_w], attr)
-                if offset > 0:
-                    self.safe_addstr(win, 2, width - 3, "^", curses.A_DIM)
-                if offset + max_rows < len(filtered):
-                    self.safe_addstr(win, 2 + max_rows - 1, width - 3, "v", curses.A_DIM)
-
-            if multi:
-                footer = "Space toggle | Enter confirm | Esc back"
+            if drawn_view != (query, offset):
+                draw_header()
+                for y in range(2, 2 + max_rows):
+                    self.safe_addstr(win, y, 1, _spaces(width - 2))
+                if not filtered:
+                    self.safe_addstr(win, 3, 2, "No matches.", curses.A_DIM)
+                else:
+                    for pos in range(offset, min(offset + max_rows, len(filtered))):
+                        draw_row(pos)
+                    draw_markers()
+                win.noutrefresh()
+                self.draw_overlay_footer(footer)
+                drawn_view = (query, offset)
             else:
-                footer = "Enter select | Esc back"
-            win.refresh()
-            self.draw_overlay_footer(footer)
-            ch = win.getch()
-            if ch == curses.KEY_RESIZE:
+                # same page: repaint the old and new highlight rows plus the counts
+                draw_header()
+                if filtered:
+                    if drawn_idx != idx and drawn_idx < len(filtered):
+                        draw_row(drawn_idx)
+                    draw_row(idx)
+                    draw_markers()
+                win.noutrefresh()
+            drawn_idx = idx
+            self._flush()
+            ch = self.read_key(win)
+            if ch == -1:
+                # interrupted (e.g. SIGWINCH); rebuild the overlay
+                win = None
+                continue
+            action = _NAV.get(ch)
+            if action == "resize":
                 self.handle_resize()
+                win = None
                 continue
-            if ch in (curses.KEY_UP, ord("k")):
-                idx = max(0, idx - 1)
+            if action == "up":
+                idx = self._coalesce_nav(win, max(0, idx - 1), max(0, len(filtered) - 1))
                 continue
-            if ch in (curses.KEY_DOWN, ord("j")):
-                idx = min(max(0, len(filtered) - 1), idx + 1)
+            if action == "down":
+                last = max(0, len(filtered) - 1)
+                idx = self._coalesce_nav(win, min(last, idx + 1), last)
                 continue
-            if ch in (10, 13):
+            if action == "enter":
                 if not filtered:
                     continue
                 if multi:
@@ -552,22 +970,27 @@ class TuiApp:
                         return [(label, _path)]
                     return [(label, path) for label, path in entries if label in selected]
                 return filtered[idx]
-            if ch == 27:
+            if action == "esc":
                 return None
-            if ch in (curses.KEY_BACKSPACE, 127, 8):
+            if action == "back":
                 query = query[:-1]
+                pool = haystacks
+                refilter = True
                 idx = 0
                 offset = 0
                 continue
-            if ch == ord(" ") and multi and filtered:
-                label, _path = filtered[idx]
-                if label in selected:
-                    selected.remove(label)
-                else:
-                    selected.add(label)
+            if action == "toggle":
+                if multi and filtered:
+                    label, _path = filtered[idx]
+                    if label in selected:
+                        selected.remove(label)
+                    else:
+                        selected.add(label)
                 continue
-            if 32 <= ch < 127 and ch != ord(" "):
-                query += chr(ch)
+            typed = _QUERY_CHARS.get(ch)
+            if typed:
+                query += typed
+                refilter = True
                 idx = 0
                 offset = 0
                 continue
@@ -583,76 +1006,56 @@ class TuiApp:
         return f"{labels[0]} +{len(labels) - 1} more"
 
     def select_list(self, entries: list[tuple[str, Path]]) -> tuple[str, Path] | None:
-        height = min(12, len(entries) + 4)
-        width = 40
-        idx = 0
-        offset = 0
-        while True:
-            win = self.make_overlay(height, width, "Select list")
-            while True:
-                max_rows = height - 4
-                if idx < offset:
-                    offset = idx
-                if idx >= offset + max_rows:
-                    offset = idx - max_rows + 1
-                view = entries[offset : offset + max_rows]
-                for i, (label, _path) in enumerate(view):
-                    attr = curses.A_REVERSE if (offset + i) == idx else curses.A_NORMAL
-                    self.safe_addstr(win, 2 + i, 2, f"{label:<20}", attr)
-                if offset > 0:
-                    self.safe_addstr(win, 1, width - 3, "^", curses.A_DIM)
-                if offset + max_rows < len(entries):
-                    self.safe_addstr(win, height - 3, width - 3, "v", curses.A_DIM)
-                win.refresh()
-                self.draw_overlay_footer("Enter select | Esc back")
-                ch = win.getch()
-                if ch in (curses.KEY_UP, ord("k")):
-                    idx = max(0, idx - 1)
-                elif ch in (curses.KEY_DOWN, ord("j")):
-                    idx = min(len(entries) - 1, idx + 1)
-                elif ch in (10, 13):
-                    return entries[idx]
-                elif ch == 27:
-                    return None
-                elif ch == curses.KEY_RESIZE:
-                    self.handle_resize()
-                    break
+        picked = self._scrollable_pick("Select list", [label for label, _path in entries], 40)
+        return None if picked is None else entries[picked]
 
     def preview_send(
         self,
         list_label: str,
         resolved: list[core.Contact],
-        missing: list[str],
+        unmatched: str,
         message: str,
     ) -> bool:
+        names = ", ".join(c.name for c in resolved)
+        # wrapped text only depends on the overlay width; rewrap after a resize changes it
+        wrapped_w: int | None = None
+        list_lines: tuple[str, ...] = ()
+        rcpt_lines: tuple[str, ...] = ()
+        msg_lines: list[tuple[str, ...]] = []
         while True:
             rows, cols = self.stdscr.getmaxyx()
             height = min(20, rows - 4)
             width = min(78, cols - 6)
             win = self.make_overlay(height, width, "Preview")
+            if width != wrapped_w:
+                wrapped_w = width
+                list_lines = _hard_wrap(f"Lists: {list_label}", width - 4)
+                rcpt_lines = _hard_wrap(f"Recipients ({len(resolved)}): {names}", width - 4)
+                msg_lines = [
+                    _hard_wrap(line, width - 4) or ("",)
+                    for line in message.splitlines() or ["(empty)"]
+                ]
             y = 2
-            list_line = f"Lists: {list_label}"
-            for line in textwrap.wrap(list_line, width - 4):
+            for line in list_lines:
                 if y >= height - 4:
                     break
                 self.safe_addstr(win, y, 2, line)
                 y += 1
-            names = ", ".join(c.name for c in resolved)
-            for line in textwrap.wrap(f"Recipients ({len(resolved)}): {names}", width - 4):
+            for line in rcpt_lines:
                 if y >= height - 4:
                     break
                 self.safe_addstr(win, y, 2, line)
                 y += 1
-            if missing and y < height - 4:
-                self.safe_addstr(win, y, 2, "Unmatched (ignored): " + ", ".join(missing), curses.A_DIM)
+            if unmatched and y < height - 4:
+                self.safe_addstr(win, y, 2, "Unmatched (ignored): " + unmatched, curses.A_DIM)
                 y += 1
 
             y += 1
             if y < height - 3:
                 self.safe_addstr(win, y, 2, "Message:", curses.A_BOLD)
                 y += 1
-            for line in message.splitlines() or ["(empty)"]:
-                for wrapped in textwrap.wrap(line, width - 4) or [""]:
+            for wrapped_line in msg_lines:
+                for wrapped in wrapped_line:
                     if y >= height - 3:
                         break
                     self.safe_addstr(win, y, 2, wrapped)
@@ -660,15 +1063,21 @@ class TuiApp:
                 if y >= height - 3:
                     break
 
-            win.refresh()
+            win.noutrefresh()
             self.draw_overlay_footer("Enter send | Esc cancel")
-            ch = win.getch()
+            self._flush()
+            ch = self.read_key(win)
             if ch == curses.KEY_RESIZE:
                 self.handle_resize()
                 continue
             return ch in (10, 13)
 
     def send_messages(self, resolved: list[core.Contact], message: str) -> None:
+        # only needed once something is sent; concurrent.futures drags in logging
+        from concurrent.futures import ThreadPoolExecutor
+
+        from engine import core
+
         rows, cols = self.stdscr.getmaxyx()
         height = min(rows - 4, max(10, len(resolved) + 6))
         width = min(70, cols - 6)
@@ -677,33 +1086,82 @@ class TuiApp:
         y = 2
         self.safe_addstr(win, y, 2, f"Sending {len(resolved)} message(s)...")
         y += 2
-        for contact in resolved:
-            per = core.personalize(message, contact.first)
-            self.safe_addstr(win, y, 2, f"-> {contact.name} ...")
-            win.refresh()
-            ok, detail = core.send_message(contact.number, per)
-            status = "OK" if ok else "FAIL"
-            info = f"{status} {contact.name}"
-            if detail:
-                info = f"{info} ({detail})"
-            self.safe_addstr(win, y, 2, info[: width - 4])
-            y += 1
-            if y >= height - 2:
-                win.scroll(1)
-                y = height - 3
-            time.sleep(0.1)
-        win.refresh()
+        # set on abort: a worker still waiting for its send slot gives up instead
+        stop = threading.Event()
+
+        def paced_send(number: str, text: str) -> tuple[bool, str]:
+            # shared limiter: the workers together never start two sends closer
+            # than SEND_DELAY, however many are in flight
+            core.wait_send_slot(SEND_DELAY)
+            if stop.is_set():
+                return False, "canceled"
+            return core.send_message(number, text)
+
+        # each send is an osascript process; keep a few in flight and report
+        # results in list order, so the log reads the same as a serial run.
+        # at most SEND_WORKERS sends are submitted ahead of the one being
+        # reported, so an abort only ever has that many left to settle
+        futures = []
+        with ThreadPoolExecutor(max_workers=SEND_WORKERS) as pool:
+            try:
+                for i, contact in enumerate(resolved):
+                    while len(futures) < min(len(resolved), i + SEND_WORKERS):
+                        nxt = resolved[len(futures)]
+                        futures.append(
+                            pool.submit(paced_send, nxt.number, core.personalize(message, nxt.first))
+                        )
+                    future = futures[i]
+                    self.safe_addstr(win, y, 2, f"-> {contact.name} ...")
+                    if not future.done():
+                        # about to block: show everything so far, progress line included.
+                        # results that are already in are drawn back to back and go out
+                        # together with the next flush
+                        win.noutrefresh()
+                        self._flush()
+                    ok, detail = future.result()
+                    status = "OK" if ok else "FAIL"
+                    info = f"{status} {contact.name}"
+                    if detail:
+                        info = f"{info} ({detail})"
+                    # pad so the result fully covers the longer "-> name ..." line
+                    self.safe_addstr(win, y, 2, info[: width - 4].ljust(width - 4))
+                    y += 1
+                    if y >= height - 2:
+                        win.scroll(1)
+                        y = height - 3
+            except BaseException:
+                # Ctrl-C and friends: drop whatever is still queued and keep waiting
+                # workers from sending, instead of letting the pool drain it all
+                stop.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        win.noutrefresh()
         self.draw_overlay_footer("Done. Press any key.")
+        self._flush()
         while True:
-            ch = win.getch()
+            ch = self.read_key(win)
             if ch == curses.KEY_RESIZE:
                 self.handle_resize()
                 return
             if ch != -1:
                 return
 
+    def entries(self) -> list[tuple[str, Path]]:
+        from engine import core
+
+        # every list lives in LISTS_DIR, so adding or removing one bumps its mtime
+        try:
+            mtime: int | None = os.stat(core.LISTS_DIR).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._entries_cache is None or self._entries_cache[0] != mtime:
+            self._entries_cache = (mtime, core.list_entries())
+        return list(self._entries_cache[1])
+
     def send_flow(self) -> None:
-        entries = core.list_entries()
+        from engine import core
+
+        entries = self.entries()
         picked = self.list_picker("Select list(s)", entries, multi=True)
         if not picked:
             return
@@ -712,19 +1170,29 @@ class TuiApp:
         list_label = self.summarize_labels(list_labels)
 
         contacts: list[core.Contact] = []
+        index = None
         for _label, list_path in picked_entries:
             try:
-                contacts.extend(core.load_contacts(list_path))
+                list_contacts, index = core.load_contacts_indexed(list_path)
             except FileNotFoundError as exc:
                 self.show_message("Missing list", str(exc))
                 return
-
+            contacts.extend(list_contacts)
+
+        # the token index comes with each list's contacts from one cache lookup; it
+        # only lines up with a single list that dedup leaves intact. merged lists
+        # get an index built by resolve_tokens instead
+        if len(picked_entries) != 1:
+            index = None
+        loaded = len(contacts)
         contacts = core.dedup(contacts)
+        if len(contacts) != loaded:
+            index = None
         if not contacts:
             self.show_message("Empty list", "Selected list(s) have no entries.")
             return
 
-        missing: list[str] = []
+        unmatched = ""
         mode = self.overlay_menu(
             "Recipients",
             [
@@ -750,7 +1218,9 @@ class TuiApp:
             if recipients is None or not recipients.strip():
                 return
             tokens = core.tokenize_names(recipients)
-            resolved, missing = core.resolve_tokens(tokens, contacts)
+            resolved, missing = core.resolve_tokens(tokens, contacts, index)
+            if missing:
+                unmatched = core.describe_missing(missing, contacts)
             if not resolved:
                 self.show_message("No recipients", "No recipients matched your input.")
                 return
@@ -762,7 +1232,7 @@ class TuiApp:
             return
 
         normalized = core.normalize_message(message)
-        if not self.preview_send(list_label, resolved, missing, normalized):
+        if not self.preview_send(list_label, resolved, unmatched, normalized):
             return
         self.send_messages(resolved, normalized)
 
@@ -784,42 +1254,58 @@ class TuiApp:
     def overlay_menu(
         self,
         title: str,
-        options: list[tuple[str, str | None]],
-    ) -> str | None:
-        height = min(12, len(options) + 4)
-        width = 32
+        options: list[tuple[str, T]],
+    ) -> T | None:
+        picked = self._scrollable_pick(title, [label for label, _value in options], 32)
+        return None if picked is None else options[picked][1]
+
+    def _scrollable_pick(self, title: str, labels: list[str], width: int) -> int | None:
+        height = min(12, len(labels) + 4)
+        max_rows = height - 4
+        rendered = [f"{label:<20}" for label in labels]
         idx = 0
         offset = 0
+        win = None
+        drawn_offset: int | None = None
+        drawn_idx = idx
         while True:
-            win = self.make_overlay(height, width, title)
-            while True:
-                max_rows = height - 4
-                if idx < offset:
-                    offset = idx
-                if idx >= offset + max_rows:
-                    offset = idx - max_rows + 1
-                view = options[offset : offset + max_rows]
-                for i, (label, _value) in enumerate(view):
-                    attr = curses.A_REVERSE if (offset + i) == idx else curses.A_NORMAL
-                    self.safe_addstr(win, 2 + i, 2, f"{label:<20}", attr)
-                if offset > 0:
-                    self.safe_addstr(win, 1, width - 3, "^", curses.A_DIM)
-                if offset + max_rows < len(options):
-                    self.safe_addstr(win, height - 3, width - 3, "v", curses.A_DIM)
-                win.refresh()
+            if win is None:
+                win = self.make_overlay(height, width, title)
+                drawn_offset = None
+            if idx < offset:
+                offset = idx
+            if idx >= offset + max_rows:
+                offset = idx - max_rows + 1
+            if offset != drawn_offset:
+                for i in range(offset, min(offset + max_rows, len(rendered))):
+                    attr = curses.A_REVERSE if i == idx else curses.A_NORMAL
+                    self.safe_addstr(win, 2 + i - offset, 2, rendered[i], attr)
+                more_above = "^" if offset > 0 else " "
+                more_below = "v" if offset + max_rows < len(rendered) else " "
+                self.safe_addstr(win, 1, width - 3, more_above, curses.A_DIM)
+                self.safe_addstr(win, height - 3, width - 3, more_below, curses.A_DIM)
+                win.noutrefresh()
                 self.draw_overlay_footer("Enter select | Esc back")
-                ch = win.getch()
-                if ch in (curses.KEY_UP, ord("k")):
-                    idx = max(0, idx - 1)
-                elif ch in (curses.KEY_DOWN, ord("j")):
-                    idx = min(len(options) - 1, idx + 1)
-                elif ch in (10, 13):
-                    return options[idx][1]
-                elif ch == 27:
-                    return None
-                elif ch == curses.KEY_RESIZE:
-                    self.handle_resize()
-                    break
+                drawn_offset = offset
+            elif idx != drawn_idx:
+                # same page: only the old and new highlight rows change
+                self.safe_addstr(win, 2 + drawn_idx - offset, 2, rendered[drawn_idx])
+                self.safe_addstr(win, 2 + idx - offset, 2, rendered[idx], curses.A_REVERSE)
+                win.noutrefresh()
+            drawn_idx = idx
+            self._flush()
+            action = _NAV.get(self.read_key(win))
+            if action == "up":
+                idx = self._coalesce_nav(win, max(0, idx - 1), len(labels) - 1)
+            elif action == "down":
+                idx = self._coalesce_nav(win, min(len(labels) - 1, idx + 1), len(labels) - 1)
+            elif action == "enter":
+                return idx
+            elif action == "esc":
+                return None
+            elif action == "resize":
+                self.handle_resize()
+                win = None
 
     def prompt_field(self, title: str, label: str) -> str | None:
         rows, cols = self.stdscr.getmaxyx()
@@ -829,8 +1315,11 @@ class TuiApp:
         return self.input_line(win, 3, 2, width - 4)
 
     def list_add_flow(self) -> None:
-        entries = core.list_entries()
-        options = [(label, label) for label, _path in entries]
+        from engine import core
+
+        entries = self.entries()
+        # menu values are the (label, path) entries themselves, so no lookup afterwards
+        options: list[tuple[str, tuple[str, Path] | str]] = [(label, (label, path)) for label, path in entries]
         options.append(("Create new list", "__new__"))
         selection = self.overlay_menu("Add to list", options)
         if selection is None:
@@ -843,16 +1332,9 @@ class TuiApp:
             list_path = core.LISTS_DIR / f"{list_label}.csv"
             if not list_path.exists():
                 core.write_contacts(list_path, [])
+                self._entries_cache = None
         else:
-            list_label = selection
-            list_path = next((p for l, p in entries if l == list_label), None)
-            if list_path is None:
-                return
-
-        try:
-            contacts = core.load_contacts(list_path)
-        except FileNotFoundError:
-            contacts = []
+            list_label, list_path = selection
 
         name = self.prompt_field("Add contact", "Name:")
         if not name:
@@ -860,13 +1342,20 @@ class TuiApp:
         raw_number = self.prompt_field("Add contact", "Number:")
         if raw_number is None:
             return
-        number = re.sub(r"[^\d+]", "", raw_number)
+        number = core.NUMBER_CLEAN_RE.sub("", raw_number)
         if not number:
             self.show_message("Invalid number", "A phone number or handle is required.")
             return
         alias = self.prompt_field("Add contact", "Alias (optional):") or ""
 
-        if any(c.number == number for c in contacts):
+        # read the list only now, after the prompts, so it reflects the file as written to
+        try:
+            contacts = core.load_contacts(list_path)
+            existing = core.load_numbers(list_path)
+        except FileNotFoundError:
+            contacts = []
+            existing = frozenset()
+        if number in existing:
             self.show_message("Duplicate", "That number already exists in the list.")
             return
 
@@ -875,17 +1364,16 @@ class TuiApp:
         self.show_message("Added", f"Added {name} to {list_label}.")
 
     def list_remove_flow(self) -> None:
-        entries = core.list_entries()
-        selection = self.overlay_menu("Remove from list", [(label, label) for label, _ in entries])
+        from engine import core
+
+        entries = self.entries()
+        selection = self.overlay_menu("Remove from list", [(entry[0], entry) for entry in entries])
         if selection is None:
             return
-        list_label = selection
-        list_path = next((p for l, p in entries if l == list_label), None)
-        if list_path is None:
-            return
+        list_label, list_path = selection
 
         try:
-            contacts = core.load_contacts(list_path)
+            contacts = core.load_contacts_sorted(list_path)
         except FileNotFoundError as exc:
             self.show_message("Missing list", str(exc))
             return
@@ -902,18 +1390,21 @@ class TuiApp:
         if confirm != "yes":
             return
 
-        remaining = [c for c in contacts if c.number not in {c.number for c in chosen}]
+        chosen_numbers = {c.number for c in chosen}
+        remaining = [c for c in contacts if c.number not in chosen_numbers]
         core.write_contacts(list_path, remaining)
         self.show_message("Removed", f"Removed {len(chosen)} from {list_label}.")
 
     def list_preview_flow(self) -> None:
-        entries = core.list_entries()
+        from engine import core
+
+        entries = self.entries()
         selected = self.select_list(entries)
         if not selected:
             return
         list_label, list_path = selected
         try:
-            contacts = core.load_contacts(list_path)
+            contacts = core.load_contacts_sorted(list_path)
         except FileNotFoundError as exc:
             self.show_message("Missing list", str(exc))
             return
@@ -923,16 +1414,26 @@ class TuiApp:
         self.contact_browser(f"Preview {list_label}", contacts, selectable=False)
 
     def show_message(self, title: str, body: str) -> None:
+        width = min(70, max(40, len(title) + 10))
+        lines = _hard_wrap(body, width - 4)[:3]
+        win = None
+        size = None
         while True:
-            width = min(70, max(40, len(title) + 10))
-            win = self.make_overlay(7, width, title)
-            for i, line in enumerate(textwrap.wrap(body, width - 4)[:3]):
-                self.safe_addstr(win, 2 + i, 2, line)
-            win.refresh()
+            if win is None:
+                size = self.stdscr.getmaxyx()
+                win = self.make_overlay(7, width, title)
+                for i, line in enumerate(lines):
+                    self.safe_addstr(win, 2 + i, 2, line)
+                win.noutrefresh()
+            else:
+                self.restage_overlay(win)
             self.draw_overlay_footer("Press any key.")
-            ch = win.getch()
+            self._flush()
+            ch = self.read_key(win)
             if ch == curses.KEY_RESIZE:
                 self.handle_resize()
+                if self.stdscr.getmaxyx() != size:
+                    win = None
                 continue
             return
 
@@ -945,17 +1446,27 @@ class TuiApp:
             "Message: Ctrl+D to finish, Esc to cancel.",
             "Keys: arrows or j/k to move, Enter to select, Esc to go back.",
         ]
+        width = 78
+        height = min(12, len(lines) + 4)
+        win = None
+        size = None
         while True:
-            width = 78
-            height = min(12, len(lines) + 4)
-            win = self.make_overlay(height, width, "Help")
-            for i, line in enumerate(lines):
-                self.safe_addstr(win, 2 + i, 2, line)
-            win.refresh()
+            # only a real size change needs a new window; otherwise resend this one
+            if win is None:
+                size = self.stdscr.getmaxyx()
+                win = self.make_overlay(height, width, "Help")
+                for i, line in enumerate(lines):
+                    self.safe_addstr(win, 2 + i, 2, line)
+                win.noutrefresh()
+            else:
+                self.restage_overlay(win)
             self.draw_overlay_footer("Press any key.")
-            ch = win.getch()
+            self._flush()
+            ch = self.read_key(win)
             if ch == curses.KEY_RESIZE:
                 self.handle_resize()
+                if self.stdscr.getmaxyx() != size:
+                    win = None
                 continue
             return
 
@@ -975,4 +1486,8 @@ def main(stdscr: "curses._CursesWindow") -> None:
 
 
 if __name__ == "__main__":
+    # run as a script: make the repo root importable so flows can load engine.core
+    ROOT = Path(__file__).resolve().parents[1]
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
     curses.wrapper(main)